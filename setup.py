@@ -10,6 +10,7 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "pandas",
+        "numpy",
         "google-generativeai",
         "tenacity",
         'tkinter',
@@ -1,132 +1,279 @@
 # src/reminder_app/database.py
 import sqlite3
+import threading
+import time
+import numpy as np
 import pandas as pd
 import os
 import logging
+from functools import lru_cache
+from urllib.parse import quote
+
+# Applied once when the shared connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA query_only = 1",
+)
+
+# How long the in-memory handle rowid -> id map is trusted before a reload
+_HANDLE_MAP_TTL = 300
+
+# Deletes every Latin-1 character that isn't an ASCII digit, in C
+_NONDIGITS = bytes(range(256)).translate(None, b'0123456789')
+_DEL_TABLE = str.maketrans('', '', _NONDIGITS.decode('latin-1'))
+
+
+def normalize_phone(value):
+    """Strip everything but the digits from a phone number or other string"""
+    digits = value.translate(_DEL_TABLE)
+    if not digits.isascii():
+        # Characters outside Latin-1 survive the table, so filter those out
+        digits = ''.join(filter(str.isdigit, digits))
+    return digits
+
+
+@lru_cache(maxsize=4096)
+def _format_phone(phone_email):
+    """Format a raw handle ID for display, cached per input"""
+    # Clean up phone numbers for better display
+    if phone_email and not '@' in phone_email:
+        # It's a phone number
+        clean_number = normalize_phone(phone_email)
+        if len(clean_number) == 10:
+            return f"({clean_number[:3]}) {clean_number[3:6]}-{clean_number[6:]}"
+        elif len(clean_number) == 11 and clean_number[0] == '1':
+            return f"+1 ({clean_number[1:4]}) {clean_number[4:7]}-{clean_number[7:]}"
+
+    # It's an email or we couldn't format the phone
+    return phone_email
+
+
+def _format_contact_names(senders):
+    """Format a Series of sender IDs (phone numbers or emails) for display"""
+    ids = senders.fillna('').astype(str)
+    digits = ids.str.replace(r'\D', '', regex=True)
+    n = digits.str.len()
+    is_phone = ~ids.str.contains('@', regex=False)
+
+    us_local = is_phone & (n == 10)
+    us_intl = is_phone & (n == 11) & digits.str.startswith('1')
+
+    formatted = np.where(
+        us_local,
+        '(' + digits.str[:3] + ') ' + digits.str[3:6] + '-' + digits.str[6:],
+        np.where(
+            us_intl,
+            '+1 (' + digits.str[1:4] + ') ' +
+            digits.str[4:7] + '-' + digits.str[7:],
+            # If it's an email or couldn't format, return as-is
+            np.where(ids == '', 'Unknown', ids)
+        )
+    )
+    return pd.Series(formatted, index=senders.index)
 
 
 class MessageDB:
+    # SQL text is kept verbatim per statement so sqlite3's statement cache
+    # hands back the already-prepared form on every repeat execution
+    _stmts = {
+        "handle_map": "SELECT rowid, id FROM handle",
+        "contact_by_rowid": """
+            SELECT DISTINCT handle.id, handle.person_centric_id
+            FROM handle
+            WHERE handle.rowid = ?
+            """,
+        "unread_messages": """
+            SELECT
+                message.rowid,
+                message.text,
+                message.is_read,
+                handle.id as sender,
+                handle.rowid as handle_id,
+                datetime(message.date/1000000000 + 978307200, 'unixepoch', 'localtime') AS sent_date,
+                message.service,
+                CASE
+                    WHEN message.is_from_me = 1 THEN 'Sent'
+                    ELSE 'Received'
+                END as direction
+            FROM message
+            JOIN handle ON message.handle_id = handle.rowid
+            WHERE message.is_read = 0
+              AND message.is_from_me = 0
+              AND message.service IN ('iMessage', 'SMS')
+              AND message.text IS NOT NULL
+              AND message.text != ''
+            ORDER BY message.date DESC
+            LIMIT ?;
+            """,
+        "conversation_context": """
+            SELECT
+                message.text,
+                message.is_from_me,
+                datetime(message.date/1000000000 + 978307200, 'unixepoch', 'localtime') AS sent_date
+            FROM message
+            JOIN handle ON message.handle_id = handle.rowid
+            WHERE handle.id = ?
+              AND message.text IS NOT NULL
+              AND message.text != ''
+            ORDER BY message.date DESC
+            LIMIT ?;
+            """,
+        # Every statistic from a single scan of the message table
+        "statistics": """
+            SELECT
+                COUNT(CASE WHEN text IS NOT NULL THEN 1 END),
+                COUNT(CASE WHEN is_read = 0 AND text IS NOT NULL AND is_from_me = 0 THEN 1 END),
+                COUNT(DISTINCT CASE WHEN is_from_me = 0 THEN handle_id END),
+                COUNT(CASE WHEN date >= (strftime('%s', 'now', 'start of day') - 978307200) * 1000000000
+                            AND text IS NOT NULL
+                            AND is_from_me = 0 THEN 1 END)
+            FROM message
+            """,
+    }
+
+    # Same query pinned to the is_read index, used only when chat.db has it
+    # (INDEXED BY on a missing index is an error, not a hint)
+    _stmts["unread_messages_indexed"] = _stmts["unread_messages"].replace(
+        "FROM message\n", "FROM message INDEXED BY message_idx_is_read\n", 1)
+
     def __init__(self, db_path=None):
         # Allow overriding the default path for testing or customization
         self.db_path = db_path or os.path.expanduser(
             "~/Library/Messages/chat.db")
-        self.contacts_cache = {}
+
+        # Bounded cache of handle ID -> display name, so long sessions with
+        # many conversations don't grow it without limit
+        self._cached_contact_name = lru_cache(maxsize=4096)(
+            self._lookup_contact_name)
+
+        # Single read-only connection shared by every query, opened lazily
+        self._conn = None
+        self._lock = threading.Lock()
+        self._unread_stmt = "unread_messages"
+
+        # handle rowid -> raw phone/email, loaded on first lookup (hold the lock)
+        self._handle_map = None
+        self._handle_map_loaded = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _connect(self):
+        """Return the shared read-only connection, opening it on first use"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                f"file:{quote(self.db_path)}?mode=ro",
+                uri=True,
+                check_same_thread=False
+            )
+
+            # The connection is read-only: map the file into memory, keep a
+            # 64 MiB page cache warm across polls and never spill temp tables
+            for pragma in _CONNECTION_PRAGMAS:
+                try:
+                    self._conn.execute(pragma)
+                except sqlite3.Error as e:
+                    logging.warning(f"Could not apply {pragma}: {e}")
+
+            if self._conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'message_idx_is_read'").fetchone():
+                self._unread_stmt = "unread_messages_indexed"
+        return self._conn
+
+    def _exec(self, key, params=()):
+        """Execute a named statement on the shared connection (hold the lock)"""
+        return self._connect().execute(self._stmts[key], params)
+
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def get_contact_name(self, handle_id):
         """Get contact name from handle ID with caching"""
-        if handle_id in self.contacts_cache:
-            return self.contacts_cache[handle_id]
+        return self._cached_contact_name(handle_id)
 
+    def _lookup_contact_name(self, handle_id):
+        """Resolve a handle ID to a display name (uncached)"""
         try:
             # Try to get the contact name from the AddressBook database
             # This is a simplified version - macOS contacts integration can be complex
-            conn = sqlite3.connect(self.db_path)
-
             # First try to get from the handle table itself
-            query = """
-            SELECT DISTINCT handle.id, handle.person_centric_id
-            FROM handle 
-            WHERE handle.rowid = ?
-            """
-
-            cursor = conn.cursor()
-            cursor.execute(query, (handle_id,))
-            result = cursor.fetchone()
-
-            if result:
-                phone_email = result[0]
-                # Clean up phone numbers for better display
-                if phone_email and not '@' in phone_email:
-                    # It's a phone number
-                    clean_number = ''.join(filter(str.isdigit, phone_email))
-                    if len(clean_number) >= 10:
-                        if len(clean_number) == 10:
-                            formatted = f"({clean_number[:3]}) {clean_number[3:6]}-{clean_number[6:]}"
-                        elif len(clean_number) == 11 and clean_number[0] == '1':
-                            formatted = f"+1 ({clean_number[1:4]}) {clean_number[4:7]}-{clean_number[7:]}"
-                        else:
-                            formatted = phone_email
-                        self.contacts_cache[handle_id] = formatted
-                        return formatted
-
-                # It's an email or we couldn't format the phone
-                self.contacts_cache[handle_id] = phone_email
-                return phone_email
+            with self._lock:
+                phone_email = self._handle_for(handle_id)
 
-            conn.close()
+            if phone_email is not None:
+                return _format_phone(phone_email)
 
         except Exception as e:
             logging.warning(
                 f"Could not resolve contact name for handle {handle_id}: {e}")
 
         # Fallback
-        self.contacts_cache[handle_id] = f"Unknown ({handle_id})"
-        return self.contacts_cache[handle_id]
-
-    def get_unread_imessages(self, limit=50):
-        """Get unread iMessages with better contact resolution"""
-        query = """
-        SELECT
-            message.rowid,
-            message.text,
-            message.is_read,
-            handle.id as sender,
-            handle.rowid as handle_id,
-            datetime(message.date/1000000000 + 978307200, 'unixepoch', 'localtime') AS sent_date,
-            message.service,
-            CASE 
-                WHEN message.is_from_me = 1 THEN 'Sent'
-                ELSE 'Received'
-            END as direction
-        FROM message
-        JOIN handle ON message.handle_id = handle.rowid
-        WHERE message.is_read = 0
-          AND message.text IS NOT NULL
-          AND message.text != ''
-          AND message.is_from_me = 0
-          AND message.service IN ('iMessage', 'SMS')
-        ORDER BY message.date DESC
-        LIMIT ?;
-        """
+        return f"Unknown ({handle_id})"
+
+    def _handle_for(self, handle_id):
+        """Map a handle rowid to its raw ID via the handle map (hold the lock)"""
+        now = time.monotonic()
+        if self._handle_map is None or now - self._handle_map_loaded > _HANDLE_MAP_TTL:
+            # The handle table is a few hundred rows, so take all of it at once
+            self._handle_map = dict(self._exec("handle_map").fetchall())
+            self._handle_map_loaded = now
+
+        if handle_id in self._handle_map:
+            return self._handle_map[handle_id]
+
+        # Handle added since the map was loaded
+        result = self._exec("contact_by_rowid", (handle_id,)).fetchone()
+        if result:
+            self._handle_map[handle_id] = result[0]
+            return result[0]
+        return None
+
+    def iter_unread_imessages(self, limit=50, chunksize=1000):
+        """Yield unread iMessages as DataFrame chunks of at most chunksize rows"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            df = pd.read_sql_query(query, conn, params=[limit])
-            conn.close()
-
-            # Add contact names
-            if not df.empty:
-                df['contact_name'] = df.apply(
-                    lambda row: self.resolve_contact_display_name(
-                        row['sender']),
-                    axis=1
-                )
-
-            return df
+            with self._lock:
+                cursor = self._exec(self._unread_stmt, (limit,))
+                columns = [col[0] for col in cursor.description]
+
+            try:
+                while True:
+                    with self._lock:
+                        rows = cursor.fetchmany(chunksize)
+                    if not rows:
+                        break
+
+                    chunk = pd.DataFrame.from_records(rows, columns=columns)
+                    # Add contact names in one vectorised pass over the column
+                    chunk['contact_name'] = _format_contact_names(
+                        chunk['sender'])
+                    yield chunk
+            finally:
+                with self._lock:
+                    cursor.close()
         except Exception as e:
             raise Exception(f"Error accessing Messages database: {e}")
 
-    def resolve_contact_display_name(self, sender_id):
-        """Resolve sender ID to a nice display name"""
-        try:
-            # Check if it's a phone number
-            if sender_id and not '@' in str(sender_id):
-                # Clean and format phone number
-                clean_number = ''.join(filter(str.isdigit, str(sender_id)))
-                if len(clean_number) >= 10:
-                    if len(clean_number) == 10:
-                        return f"({clean_number[:3]}) {clean_number[3:6]}-{clean_number[6:]}"
-                    elif len(clean_number) == 11 and clean_number[0] == '1':
-                        return f"+1 ({clean_number[1:4]}) {clean_number[4:7]}-{clean_number[7:]}"
-
-            # If it's an email or couldn't format, return as-is
-            return str(sender_id) if sender_id else "Unknown"
-
-        except Exception:
-            return "Unknown"
+    def get_unread_imessages(self, limit=50):
+        """Get unread iMessages with better contact resolution"""
+        chunks = list(self.iter_unread_imessages(limit))
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
 
     def mark_messages_as_read(self, message_ids):
         """Mark specific messages as read (optional feature)"""
         try:
+            # The shared connection is read-only, so writes get their own
+            # short-lived connection
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
@@ -145,63 +292,30 @@ class MessageDB:
             raise
 
     def get_conversation_context(self, sender_id, limit=5):
-        """Get recent conversation context for better reminder generation"""
-        query = """
-        SELECT
-            message.text,
-            message.is_from_me,
-            datetime(message.date/1000000000 + 978307200, 'unixepoch', 'localtime') AS sent_date
-        FROM message
-        JOIN handle ON message.handle_id = handle.rowid
-        WHERE handle.id = ?
-          AND message.text IS NOT NULL
-          AND message.text != ''
-        ORDER BY message.date DESC
-        LIMIT ?;
-        """
+        """Get recent conversation context for better reminder generation
 
+        Returns a list of (text, is_from_me, sent_date) tuples, newest first.
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            df = pd.read_sql_query(query, conn, params=[sender_id, limit])
-            conn.close()
-            return df
+            with self._lock:
+                return self._exec(
+                    "conversation_context", (sender_id, limit)).fetchall()
         except Exception as e:
             logging.error(f"Error getting conversation context: {e}")
-            return pd.DataFrame()
+            return []
 
     def get_statistics(self):
         """Get database statistics"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            stats = {}
+            with self._lock:
+                row = self._exec("statistics").fetchone()
 
-            # Total messages
-            cursor.execute(
-                "SELECT COUNT(*) FROM message WHERE text IS NOT NULL")
-            stats['total_messages'] = cursor.fetchone()[0]
+            stats = dict(zip(
+                ('total_messages', 'unread_messages',
+                 'unique_contacts', 'messages_today'),
+                row
+            ))
 
-            # Unread messages
-            cursor.execute(
-                "SELECT COUNT(*) FROM message WHERE is_read = 0 AND text IS NOT NULL AND is_from_me = 0")
-            stats['unread_messages'] = cursor.fetchone()[0]
-
-            # Unique contacts
-            cursor.execute(
-                "SELECT COUNT(DISTINCT handle_id) FROM message WHERE is_from_me = 0")
-            stats['unique_contacts'] = cursor.fetchone()[0]
-
-            # Messages today
-            cursor.execute("""
-                SELECT COUNT(*) FROM message 
-                WHERE date >= (strftime('%s', 'now', 'start of day') - 978307200) * 1000000000
-                AND text IS NOT NULL
-                AND is_from_me = 0
-            """)
-            stats['messages_today'] = cursor.fetchone()[0]
-
-            conn.close()
             return stats
 
         except Exception as e:
@@ -1,18 +1,220 @@
 # src/reminder_app/llm.py
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 import google.generativeai as genai
-from config import GOOGLE_API_KEY, TODAY
+from google.api_core import exceptions as google_exceptions
+from config import GOOGLE_API_KEY
+from llm_cache import MISS, cache_key
+import asyncio
+import json
 import logging
 import re
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+def _keyword_re(keywords):
+    """Compile a list of lowercase keywords into one substring-matching regex"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# Keyword tables are compiled once at import rather than rebuilt per message
+_URGENT_RE = _keyword_re([
+    'urgent', 'asap', 'emergency', 'immediately', 'right now',
+    'urgent!', 'help!', 'critical', 'important!', 'deadline'
+])
+
+_HIGH_PRIORITY_RE = _keyword_re([
+    'today', 'tonight', 'this morning', 'this afternoon',
+    'need now', 'quick', 'fast', 'soon'
+])
+
+# Cheap local test for messages worth sending to Gemini at all
+_ACTIONABLE_RE = re.compile(
+    r'\?|\b(can|please|remember|meeting|call|tomorrow|tonight|due|deadline|pick up|need)\b',
+    re.I)
+
+
+def _looks_actionable(text):
+    """Return False for short chitchat ("lol", "ok", emoji) with no request,
+    question or time word, which Gemini would only answer "NO" to"""
+    return len(text) >= 25 or bool(_ACTIONABLE_RE.search(text))
+
+
+# Only rate limiting and brief outages are worth retrying, and quickly enough
+# that the UI doesn't look hung; anything else is raised on the first failure
+_retry_transient = retry(
+    retry=retry_if_exception_type((
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+    )),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=20),
+)
+
+# Outermost JSON array in a batch response that wasn't returned as bare JSON
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.S)
+
+# Batch result for a message the model's reply didn't cover; unlike None
+# ("not actionable") it is an unknown, to be asked again rather than cached
+UNANSWERED = object()
+
+# Longest a blocking caller waits for one batch, retries included
+_BATCH_TIMEOUT = 300
+
+# Look for common name patterns
+_NAME_PATTERNS = (
+    re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'),  # First Last
+    # Name before action verbs
+    re.compile(r'\b[A-Z][a-z]+\b(?=\s(?:said|told|asked|mentioned))'),
+)
+
+# One pattern per category, since keywords are shared between categories
+# ('appointment') and nest inside each other ('get' inside 'budget')
+_CATEGORY_RES = {
+    category: _keyword_re(keywords) for category, keywords in {
+        'meeting': ['meeting', 'call', 'appointment', 'conference', 'zoom'],
+        'task': ['task', 'work', 'project', 'assignment', 'job'],
+        'personal': ['dinner', 'lunch', 'family', 'friend', 'birthday'],
+        'shopping': ['buy', 'pick up', 'get', 'purchase', 'store'],
+        'travel': ['flight', 'trip', 'travel', 'vacation', 'hotel'],
+        'health': ['doctor', 'appointment', 'dentist', 'medication', 'hospital'],
+        'finance': ['payment', 'bill', 'bank', 'money', 'budget']
+    }.items()
+}
+
+
+# Static prompt text is built once at import; only the per-message fields are
+# filled in per call with str.format_map
+_PROMPT_TASK_TYPES = """Types of actionable items include:
+- Direct requests ("Can you...", "Please...")
+- Appointments/meetings ("Let's meet...", "See you at...")
+- Tasks with deadlines ("Need this by...", "Due...")
+- Events ("Don't forget...", "Remember to...")
+- Questions that need responses
+- Commitments made ("I'll...", "We should...")"""
+
+_PROMPT_DATE_RULES = """AppleScript date formatting rules:
+- Specific date/time: date "MM/DD/YYYY HH:MM AM/PM"
+- Date only: date "MM/DD/YYYY 12:00 PM"
+- No clear timing: missing value
+
+Time inference guidelines:
+- "today" = today at 6:00 PM
+- "tomorrow" = tomorrow at 12:00 PM
+- "this week" = Friday at 5:00 PM
+- "next week" = next Friday at 12:00 PM
+- "ASAP" or "urgent" = today at 8:00 PM
+- For questions/responses = tomorrow at 10:00 AM
+- Meeting times = use exact time mentioned"""
+
+_PROMPT_TEMPLATE = """
+You are an expert AI assistant that identifies actionable tasks and reminders from text messages.
+
+Your job is to:
+1. Determine if the message contains ANY actionable item, task, request, or something that needs follow-up
+2. If yes, create a clear, concise reminder
+3. Extract or infer an appropriate due date/time
+
+""" + _PROMPT_TASK_TYPES + """
+
+Current date/time: {today} (today)
+Message from {sender}: "{text}"
+{context}
+
+RESPONSE FORMAT (must be exact):
+A JSON object: {{"actionable": true, "reminder": "<clear, actionable reminder text in 1-2 sentences>", "due": "<AppleScript date format OR missing value>"}}
+
+""" + _PROMPT_DATE_RULES + """
+
+If NO actionable item is found, respond with: {{"actionable": false, "reminder": "", "due": "missing value"}}
+
+Examples:
+Message: "Can you pick up milk on your way home?"
+{{"actionable": true, "reminder": "Pick up milk on the way home", "due": "date \\"{today} 06:00 PM\\""}}
+
+Message: "Meeting at 3pm tomorrow"
+{{"actionable": true, "reminder": "Attend meeting", "due": "date \\"{tomorrow} 03:00 PM\\""}}
+"""
+
+# Structured-output schema the single-message prompt is constrained to
+_REMINDER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "actionable": {"type": "boolean"},
+        "reminder": {"type": "string"},
+        "due": {"type": "string"},
+    },
+    "required": ["actionable", "reminder", "due"],
+}
+
+_BATCH_PROMPT_TEMPLATE = """
+You are an expert AI assistant that identifies actionable tasks and reminders from text messages.
+
+For EACH numbered message below:
+1. Determine if the message contains ANY actionable item, task, request, or something that needs follow-up
+2. If yes, create a clear, concise reminder
+3. Extract or infer an appropriate due date/time
+
+""" + _PROMPT_TASK_TYPES + """
+
+Current date/time: {today} (today)
+
+Messages:
+{messages}
+
+RESPONSE FORMAT (must be exact):
+A JSON array with one object per message, in order:
+{{"idx": <message number>, "reminder": "<clear, actionable reminder text in 1-2 sentences>", "due": "<AppleScript date format OR missing value>"}}
+If a message has NO actionable item, use: {{"idx": <message number>, "skip": true}}
+
+""" + _PROMPT_DATE_RULES + """
+
+Example:
+Messages:
+1. [Alex]: "Can you pick up milk on your way home?"
+2. [Sam]: "lol"
+Response:
+[{{"idx": 1, "reminder": "Pick up milk on the way home", "due": "date \\"{today} 06:00 PM\\""}}, {{"idx": 2, "skip": true}}]
+"""
+
+
+def _shutdown_loop(loop):
+    """Cancel the loop's tasks and stop it once they have unwound (loop thread)"""
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        asyncio.gather(*tasks, return_exceptions=True).add_done_callback(
+            lambda _: loop.stop())
+    else:
+        loop.stop()
+
+
+@lru_cache(maxsize=1)
+def _today_strings(minute_bucket):
+    """Return (today, tomorrow) as MM/DD/YYYY, recomputed once per minute"""
+    now = datetime.now()
+    return (now.strftime('%m/%d/%Y'),
+            (now + timedelta(days=1)).strftime('%m/%d/%Y'))
+
+
+def _prompt_dates():
+    """Today's prompt date fields, cached for the current minute"""
+    today, tomorrow = _today_strings(int(time.time() // 60))
+    return {"today": today, "tomorrow": tomorrow}
+
+
 class GeminiLLM:
-    def __init__(self):
+    def __init__(self, cache=None):
+        # Optional LLMCache for single-message answers, shared with whoever
+        # caches the batch answers under the same cache_key
+        self._cache = cache
         try:
             genai.configure(api_key=GOOGLE_API_KEY)
             self.model = genai.GenerativeModel('gemini-1.5-flash')
@@ -23,131 +225,142 @@ class GeminiLLM:
                 top_p=0.8,
                 top_k=40,
                 max_output_tokens=500,
+                response_mime_type="application/json",
+                response_schema=_REMINDER_SCHEMA,
+            )
+
+            # Batched prompts answer with a JSON array covering every message
+            self.batch_generation_config = genai.types.GenerationConfig(
+                temperature=0.3,
+                top_p=0.8,
+                top_k=40,
+                max_output_tokens=2048,
+                response_mime_type="application/json",
             )
 
+            # Event loop for the async API, started on first use
+            self._loop = None
+            self._loop_lock = threading.Lock()
+            self._closed = False
+
         except Exception as e:
             logging.error(f"Failed to initialize Gemini API: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=2, min=30, max=120))
+    @_retry_transient
     def generate_reminder(self, text: str, sender: str = "Unknown", conversation_context=None):
-        """Generate a reminder from a text message with enhanced prompting"""
-        try:
-            # Build context if available
-            context_text = ""
-            if conversation_context and not conversation_context.empty:
-                context_text = "\n\nRecent conversation context:\n"
-                for _, msg in conversation_context.head(3).iterrows():
-                    sender_label = "Me" if msg['is_from_me'] else "Them"
-                    context_text += f"{sender_label}: {msg['text'][:100]}...\n"
-
-            prompt = f"""
-            You are an expert AI assistant that identifies actionable tasks and reminders from text messages.
-
-            Your job is to:
-            1. Determine if the message contains ANY actionable item, task, request, or something that needs follow-up
-            2. If yes, create a clear, concise reminder
-            3. Extract or infer an appropriate due date/time
-
-            Types of actionable items include:
-            - Direct requests ("Can you...", "Please...")
-            - Appointments/meetings ("Let's meet...", "See you at...")
-            - Tasks with deadlines ("Need this by...", "Due...")
-            - Events ("Don't forget...", "Remember to...")
-            - Questions that need responses
-            - Commitments made ("I'll...", "We should...")
-
-            Current date/time: {TODAY} (today)
-            Message from {sender}: "{text}"
-            {context_text}
-
-            RESPONSE FORMAT (must be exact):
-            REMINDER: [Clear, actionable reminder text in 1-2 sentences]
-            DUE: [AppleScript date format OR "missing value"]
-
-            AppleScript date formatting rules:
-            - Specific date/time: date "MM/DD/YYYY HH:MM AM/PM"
-            - Date only: date "MM/DD/YYYY 12:00 PM"
-            - No clear timing: missing value
-
-            Time inference guidelines:
-            - "today" = today at 6:00 PM
-            - "tomorrow" = tomorrow at 12:00 PM  
-            - "this week" = Friday at 5:00 PM
-            - "next week" = next Friday at 12:00 PM
-            - "ASAP" or "urgent" = today at 8:00 PM
-            - For questions/responses = tomorrow at 10:00 AM
-            - Meeting times = use exact time mentioned
-
-            If NO actionable item is found, respond with exactly: "NO"
-
-            Examples:
-            Message: "Can you pick up milk on your way home?"
-            REMINDER: Pick up milk on the way home
-            DUE: date "{datetime.now().strftime('%m/%d/%Y')} 06:00 PM"
-
-            Message: "Meeting at 3pm tomorrow"
-            REMINDER: Attend meeting
-            DUE: date "{(datetime.now() + timedelta(days=1)).strftime('%m/%d/%Y')} 03:00 PM"
-            """
+        """Generate a reminder from a text message with enhanced prompting
+
+        Without conversation context, a message answered before (alone or
+        in a batch) comes from the cache, if the client has one.
+        """
+        key = self._reminder_key(text, sender, conversation_context)
+        cached = self._cached_reminder(key)
+        if cached is not MISS:
+            return cached
 
+        try:
             response = self.model.generate_content(
-                prompt,
+                self._build_prompt(text, sender, conversation_context),
                 generation_config=self.generation_config
             )
+            return self._store_reminder(key, self._parse_response(response, sender))
 
-            if not response or not response.text:
-                logging.error("Empty response from Gemini API")
-                return None
-
-            reminder_response = response.text.strip()
-
-            # Check if no actionable item found
-            if reminder_response.upper().strip() == "NO":
-                return None
-
-            # Parse the response
-            lines = [line.strip()
-                     for line in reminder_response.split('\n') if line.strip()]
-
-            if len(lines) < 2:
-                logging.error(
-                    f"Unexpected response format: {reminder_response}")
-                return None
-
-            reminder_line = None
-            due_line = None
+        except Exception as e:
+            logging.error(f"Error generating reminder: {e}")
+            raise
 
-            for line in lines:
-                if line.startswith("REMINDER:"):
-                    reminder_line = line
-                elif line.startswith("DUE:"):
-                    due_line = line
+    @_retry_transient
+    async def generate_reminder_async(self, text: str, sender: str = "Unknown", conversation_context=None):
+        """Async variant of generate_reminder for use with asyncio.gather"""
+        key = self._reminder_key(text, sender, conversation_context)
+        cached = self._cached_reminder(key)
+        if cached is not MISS:
+            return cached
 
-            if not reminder_line or not due_line:
-                logging.error(
-                    f"Missing REMINDER or DUE line in response: {reminder_response}")
-                return None
+        try:
+            response = await self.model.generate_content_async(
+                self._build_prompt(text, sender, conversation_context),
+                generation_config=self.generation_config
+            )
+            return self._store_reminder(key, self._parse_response(response, sender))
 
-            # Extract reminder text and due date
-            reminder_text = reminder_line.replace("REMINDER:", "").strip()
-            if reminder_text.startswith('"') and reminder_text.endswith('"'):
-                reminder_text = reminder_text[1:-1]
+        except Exception as e:
+            logging.error(f"Error generating reminder: {e}")
+            raise
 
-            due_date = due_line.replace("DUE:", "").strip()
+    def _reminder_key(self, text, sender, conversation_context):
+        """Cache key for a single-message request, or None if it isn't
+        cached: no cache, or an answer that depends on the context"""
+        if self._cache is None or conversation_context:
+            return None
+        return cache_key(self.model.model_name, sender, text)
+
+    def _cached_reminder(self, key):
+        """The cached answer for a key as generate_reminder returns it, or MISS"""
+        if key is None:
+            return MISS
+        result = self._cache.get(key, MISS)
+        # JSON hands the result tuple back as a list
+        return tuple(result) if isinstance(result, list) else result
+
+    def _store_reminder(self, key, result):
+        """Cache a parsed answer and return it; an unanswered request is
+        returned as None and not cached"""
+        if result is UNANSWERED:
+            return None
+        if key is not None:
+            self._cache.set(key, result)
+        return result
+
+    def _build_prompt(self, text, sender, conversation_context=None):
+        """Build the single-message reminder prompt"""
+        # Build context if available
+        context_text = ""
+        if conversation_context:
+            context_text = "\n\nRecent conversation context:\n"
+            for msg_text, is_from_me, _ in conversation_context[:3]:
+                sender_label = "Me" if is_from_me else "Them"
+                context_text += f"{sender_label}: {msg_text[:100]}...\n"
+
+        fields = _prompt_dates()
+        fields.update(sender=sender, text=text, context=context_text)
+        return _PROMPT_TEMPLATE.format_map(fields)
+
+    def _parse_response(self, response, sender):
+        """Parse a structured JSON response into a (text, due, sender) tuple
+
+        None means not actionable; an empty or malformed response is
+        UNANSWERED.
+        """
+        if not response or not response.text:
+            logging.error("Empty response from Gemini API")
+            return UNANSWERED
+
+        # A schema violation won't be fixed by asking again, so drop the
+        # message instead of raising into the retry
+        try:
+            item = json.loads(response.text)
+            actionable = item["actionable"]
+            reminder_text = item.get("reminder")
+            due_date = item.get("due")
+        except (ValueError, TypeError, KeyError) as e:
+            logging.error(
+                f"Unexpected response format: {response.text} ({e})")
+            return UNANSWERED
 
-            # Validate and clean up the reminder text
-            reminder_text = self._clean_reminder_text(reminder_text)
-            due_date = self._validate_due_date(due_date)
+        # Check if no actionable item found
+        if not actionable:
+            return None
 
-            logging.info(
-                f"Generated reminder: {reminder_text[:50]}... | Due: {due_date}")
+        # The date is still interpolated into AppleScript, so keep checking it
+        reminder_text = self._clean_reminder_text(reminder_text)
+        due_date = self._validate_due_date(due_date)
 
-            return (reminder_text, due_date, sender)
+        logging.info(
+            f"Generated reminder: {reminder_text[:50]}... | Due: {due_date}")
 
-        except Exception as e:
-            logging.error(f"Error generating reminder: {e}")
-            raise
+        return (reminder_text, due_date, sender)
 
     def _clean_reminder_text(self, text):
         """Clean and validate reminder text"""
@@ -189,53 +402,192 @@ class GeminiLLM:
         # If we can't parse it, return missing value
         return 'missing value'
 
-    def batch_generate_reminders(self, messages_df, batch_size=5):
-        """Generate reminders for multiple messages in batches"""
-        reminders = []
-
-        for i in range(0, len(messages_df), batch_size):
-            batch = messages_df.iloc[i:i+batch_size]
-
-            for _, row in batch.iterrows():
+    def batch_generate_reminders(self, messages, batch_size=20, max_concurrency=8, raise_errors=False):
+        """Generate reminders for many messages, up to batch_size per request
+
+        messages is a list of (sender, text) pairs, or a DataFrame with a
+        text column and optionally a sender column. Returns a list aligned
+        with it, holding None for every message without an actionable item
+        and UNANSWERED for any the reply left out. A failed batch (an API
+        error, or an empty or malformed reply) is logged and its messages
+        left UNANSWERED, or raised with raise_errors=True.
+        """
+        future = self.run_async(self.batch_generate_reminders_async(
+            messages, batch_size, max_concurrency, raise_errors))
+
+        # Each batch has its own _BATCH_TIMEOUT; this only guards the whole
+        # call, allowing one per round of max_concurrency batches
+        batches = -(-len(messages) // batch_size)
+        rounds = -(-batches // max_concurrency)
+        try:
+            return future.result(timeout=_BATCH_TIMEOUT * (rounds + 1))
+        except TimeoutError:
+            future.cancel()
+            raise Exception(
+                f"Gemini batch requests timed out after {_BATCH_TIMEOUT * (rounds + 1)}s")
+
+    async def batch_generate_reminders_async(self, messages, batch_size=20, max_concurrency=8, raise_errors=False):
+        """Async variant of batch_generate_reminders, running the batches
+        concurrently with at most max_concurrency requests in flight"""
+        if hasattr(messages, "itertuples"):
+            messages = [(getattr(row, "sender", "Unknown"), row.text)
+                        for row in messages.itertuples(index=False)]
+        results = [None] * len(messages)
+
+        # Drop obvious chitchat locally instead of paying a round-trip for "NO"
+        kept = [idx for idx, (_, text) in enumerate(messages)
+                if _looks_actionable(text)]
+        logging.info(
+            f"Pre-filter kept {len(kept)} of {len(messages)} messages for Gemini")
+
+        batches = [kept[i:i + batch_size]
+                   for i in range(0, len(kept), batch_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(batch):
+            async with semaphore:
                 try:
-                    sender = row.get("sender", "Unknown")
-                    text = row["text"]
-
-                    result = self.generate_reminder(text, sender)
-                    if result:
-                        reminders.append(result)
-
-                except Exception as e:
-                    logging.error(f"Failed to process message in batch: {e}")
-                    continue
+                    return await asyncio.wait_for(
+                        self._generate_batch_async(
+                            [messages[idx] for idx in batch]),
+                        _BATCH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    raise Exception(
+                        f"Gemini batch request timed out after {_BATCH_TIMEOUT}s")
+
+        batch_results = await asyncio.gather(
+            *(bounded(batch) for batch in batches), return_exceptions=True)
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                if raise_errors:
+                    raise batch_result
+                logging.error(f"Failed to process message batch: {batch_result}")
+                batch_result = [UNANSWERED] * len(batch)
+            for idx, result in zip(batch, batch_result):
+                results[idx] = result
+
+        return results
+
+    @_retry_transient
+    async def _generate_batch_async(self, messages):
+        """Generate reminders for a list of (sender, text) pairs in one request
+
+        Returns a list aligned with messages, holding None for every message
+        without an actionable item and UNANSWERED for any the reply left out.
+        """
+        response = await self.model.generate_content_async(
+            self._build_batch_prompt(messages),
+            generation_config=self.batch_generation_config
+        )
+
+        if not response or not response.text:
+            raise Exception("Empty response from Gemini API")
+
+        return self._parse_batch_response(response.text, messages)
+
+    def run_async(self, coro):
+        """Schedule a coroutine on the client's event loop thread
+
+        The async Gemini client is bound to the loop it is first used on, so
+        every coroutine runs on one long-lived loop. Returns a
+        concurrent.futures.Future that Tk callers can poll with root.after.
+        """
+        with self._loop_lock:
+            if self._closed:
+                coro.close()
+                raise Exception("Gemini client is closed")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever,
+                                 name="gemini-async", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def close(self):
+        """Cancel every pending request and stop the event loop thread
+
+        Callers blocked on a run_async future get a CancelledError rather
+        than waiting on a loop that no longer runs.
+        """
+        with self._loop_lock:
+            self._closed = True
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(_shutdown_loop, self._loop)
+                self._loop = None
+
+    def _build_batch_prompt(self, messages):
+        """Build a single prompt covering every message in the batch"""
+        numbered = "\n".join(
+            f'{idx}. [{sender}]: "{text}"'
+            for idx, (sender, text) in enumerate(messages, start=1)
+        )
+
+        fields = _prompt_dates()
+        fields["messages"] = numbered
+        return _BATCH_PROMPT_TEMPLATE.format_map(fields)
+
+    def _parse_batch_response(self, response_text, messages):
+        """Map a JSON array response back onto the batch's messages
+
+        Only messages the reply answers, with a reminder or an explicit
+        skip, get a result; the rest stay UNANSWERED. A reply that isn't a
+        JSON array (or single object) raises.
+        """
+        try:
+            items = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Fall back to the first [...] block if the model wrapped the JSON
+            match = _JSON_ARRAY_RE.search(response_text)
+            if not match:
+                raise Exception(
+                    f"Unexpected batch response format: {response_text}")
+            try:
+                items = json.loads(match.group(0))
+            except json.JSONDecodeError as e:
+                raise Exception(f"Malformed batch response: {e}")
+
+        if isinstance(items, dict):
+            items = [items]
+        if not isinstance(items, list):
+            raise Exception(
+                f"Unexpected batch response type: {type(items).__name__}")
+
+        results = [UNANSWERED] * len(messages)
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+
+            idx = item.get("idx")
+            if (not isinstance(idx, int) or isinstance(idx, bool) or
+                    not 1 <= idx <= len(messages)):
+                continue
+
+            if item.get("skip"):
+                results[idx - 1] = None
+                continue
+
+            reminder = item.get("reminder")
+            if not isinstance(reminder, str) or not reminder.strip():
+                continue
+
+            sender = messages[idx - 1][0]
+            reminder_text = self._clean_reminder_text(reminder)
+            due_date = self._validate_due_date(item.get("due"))
 
-            # Brief pause between batches to respect API limits
-            import time
-            time.sleep(1)
+            logging.info(
+                f"Generated reminder: {reminder_text[:50]}... | Due: {due_date}")
+            results[idx - 1] = (reminder_text, due_date, sender)
 
-        return reminders
+        return results
 
     def analyze_message_urgency(self, text):
         """Analyze message to determine urgency level"""
-        urgent_keywords = [
-            'urgent', 'asap', 'emergency', 'immediately', 'right now',
-            'urgent!', 'help!', 'critical', 'important!', 'deadline'
-        ]
-
-        high_priority_keywords = [
-            'today', 'tonight', 'this morning', 'this afternoon',
-            'need now', 'quick', 'fast', 'soon'
-        ]
-
         text_lower = text.lower()
 
-        for keyword in urgent_keywords:
-            if keyword in text_lower:
-                return 'urgent'
+        if _URGENT_RE.search(text_lower):
+            return 'urgent'
 
-        for keyword in high_priority_keywords:
-            if keyword in text_lower:
-                return 'high'
+        if _HIGH_PRIORITY_RE.search(text_lower):
+            return 'high'
 
         return 'normal'
 
@@ -244,37 +596,16 @@ class GeminiLLM:
         # Simple name extraction - could be enhanced with NLP
         people = []
 
-        # Look for common name patterns
-        name_patterns = [
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # First Last
-            # Name before action verbs
-            r'\b[A-Z][a-z]+\b(?=\s(?:said|told|asked|mentioned))',
-        ]
-
-        for pattern in name_patterns:
-            matches = re.findall(pattern, text)
-            people.extend(matches)
+        for pattern in _NAME_PATTERNS:
+            people.extend(pattern.findall(text))
 
         return list(set(people))  # Remove duplicates
 
     def suggest_reminder_categories(self, text):
         """Suggest categories for the reminder"""
-        categories = {
-            'meeting': ['meeting', 'call', 'appointment', 'conference', 'zoom'],
-            'task': ['task', 'work', 'project', 'assignment', 'job'],
-            'personal': ['dinner', 'lunch', 'family', 'friend', 'birthday'],
-            'shopping': ['buy', 'pick up', 'get', 'purchase', 'store'],
-            'travel': ['flight', 'trip', 'travel', 'vacation', 'hotel'],
-            'health': ['doctor', 'appointment', 'dentist', 'medication', 'hospital'],
-            'finance': ['payment', 'bill', 'bank', 'money', 'budget']
-        }
-
         text_lower = text.lower()
-        suggested = []
-
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
-                suggested.append(category)
+        suggested = [category for category, pattern in _CATEGORY_RES.items()
+                     if pattern.search(text_lower)]
 
         return suggested if suggested else ['general']
 
@@ -0,0 +1,107 @@
+# src/reminder_app/llm_cache.py
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+# Where LLM results persist between runs
+_CACHE_PATH = os.path.expanduser(
+    "~/Library/Caches/ReminderApp/llm_cache.db")
+
+# Returned by get for a key with nothing cached (None is a cached answer)
+MISS = object()
+
+# Cached answers older than this are asked again
+_DEFAULT_TTL = 7 * 24 * 3600
+
+# Expired rows are deleted on open and again after this many writes
+_PRUNE_EVERY = 1000
+
+
+def cache_key(model, sender, text):
+    """Content address of one LLM request"""
+    payload = json.dumps({"m": model, "s": sender, "t": text}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed cache of LLM results, keyed by cache_key"""
+
+    def __init__(self, path=None, ttl=_DEFAULT_TTL):
+        self.path = path or _CACHE_PATH
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+        # One connection shared by the LLM pool threads
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB,
+                    ts INTEGER
+                )
+                """)
+            self._conn.commit()
+            self._prune()
+        except (OSError, sqlite3.Error) as e:
+            # Without the file every lookup is a miss and nothing is stored
+            logging.warning(f"Could not open LLM cache {self.path}: {e}")
+            self._conn = None
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            row = None
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value FROM llm_cache WHERE key = ? AND ts >= ?",
+                        (key, int(time.time() - self.ttl))).fetchone()
+                except sqlite3.Error as e:
+                    logging.warning(f"LLM cache read failed: {e}")
+
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        """Store a JSON-serialisable value under key"""
+        blob = json.dumps(value).encode()
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, ts) VALUES (?, ?, ?)",
+                    (key, blob, int(time.time())))
+                self._conn.commit()
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 0:
+                    self._prune()
+            except sqlite3.Error as e:
+                logging.warning(f"LLM cache write failed: {e}")
+
+    def _prune(self):
+        """Delete the rows get no longer returns (caller holds the lock)"""
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE ts < ?", (int(time.time() - self.ttl),))
+        self._conn.commit()
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,6 +3,9 @@ import tkinter as tk
 from tkinter import messagebox
 import logging
 import sys
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import os
 from ui import ReminderUI
 
@@ -14,15 +17,30 @@ def setup_logging():
 
     log_file = os.path.join(log_dir, "reminder_app.log")
 
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    # Callers only enqueue the record; a background thread does the file and
+    # console writes so logging never blocks the Tk main thread on disk.
+    # The queue side only renders the message text, the listener's handlers
+    # add the timestamp. force=True because llm.py's import-time basicConfig
+    # already ran
+    log_queue = queue.SimpleQueue()
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        format='%(message)s',
+        handlers=[QueueHandler(log_queue)],
+        force=True
     )
 
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
 
 def check_requirements():
     """Check if all requirements are met"""
@@ -80,6 +98,7 @@ def main():
         # Handle window closing
         def on_closing():
             logger.info("Application closing...")
+            app.close()
             root.destroy()
 
         root.protocol("WM_DELETE_WINDOW", on_closing)
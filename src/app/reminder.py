@@ -1,16 +1,519 @@
 # src/reminder_app/reminder.py
 import subprocess
+import asyncio
 import logging
-import re
+import hashlib
+import json
+import os
+import queue
+import select
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# JXA driver run by the long-lived osascript process: reads one JSON request
+# per line from stdin, runs its AppleScript source or compiled .scpt file with
+# "run script" (passing any args to its run handler) and answers with one
+# JSON line on stdout. Requests are ASCII-only JSON, so a
+# read can never split a multi-byte character
+_OSA_DRIVER = r'''
+ObjC.import("Foundation");
+var app = Application.currentApplication();
+app.includeStandardAdditions = true;
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+
+function reply(obj) {
+    var line = $(JSON.stringify(obj) + "\n");
+    stdout.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function run() {
+    var buffer = "";
+    while (true) {
+        var data = stdin.availableData;
+        if (data.length == 0) {
+            return;  // Parent closed the pipe
+        }
+        buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+
+        var nl;
+        while ((nl = buffer.indexOf("\n")) >= 0) {
+            var request = JSON.parse(buffer.slice(0, nl));
+            buffer = buffer.slice(nl + 1);
+            try {
+                var options = {withParameters: request.args || []};
+                var target = request.script;
+                if (request.path) {
+                    target = Path(request.path);  // Compiled .scpt
+                } else {
+                    options["in"] = "AppleScript";
+                }
+                var out = app.runScript(target, options);
+                reply({ok: true, out: (out === undefined || out === null) ? "" : String(out)});
+            } catch (e) {
+                reply({ok: false, err: String(e.message || e)});
+            }
+        }
+    }
+}
+'''
+
+
+# Fixed scripts, compiled once to .scpt files and run with argv values, so
+# neither the compile nor any string escaping happens per call
+_SCRIPT_CACHE_DIR = os.path.expanduser("~/Library/Caches/ReminderApp")
+
+_SCRIPT_SOURCES = {
+    # argv: reminder text, date string, list name
+    "create_with_date": '''
+        on run argv
+            set reminderText to item 1 of argv
+            set dueDateStr to item 2 of argv
+            set listName to item 3 of argv
+
+            set usedDefaultList to false
+            tell application "Reminders"
+                try
+                    set targetList to list listName
+                on error
+                    set targetList to default list
+                    set usedDefaultList to true
+                end try
+
+                try
+                    set dueDateObj to date dueDateStr
+                    make new reminder at end of targetList with properties {name:reminderText, due date:dueDateObj}
+                on error errorMsg
+                    -- Fallback: create without date if date parsing fails
+                    make new reminder at end of targetList with properties {name:reminderText}
+                    log "Date parsing failed, created reminder without date: " & errorMsg
+                end try
+            end tell
+
+            if usedDefaultList then return "default list"
+            return ""
+        end run
+''',
+    # argv: reminder text, days from now, list name
+    "create_with_day_offset": '''
+        on run argv
+            set reminderText to item 1 of argv
+            set dueDateObj to (current date) + (item 2 of argv as integer) * days
+            set listName to item 3 of argv
+
+            set usedDefaultList to false
+            tell application "Reminders"
+                try
+                    set targetList to list listName
+                on error
+                    set targetList to default list
+                    set usedDefaultList to true
+                end try
+
+                make new reminder at end of targetList with properties {name:reminderText, due date:dueDateObj}
+            end tell
+
+            if usedDefaultList then return "default list"
+            return ""
+        end run
+''',
+    # argv: reminder text, list name
+    "create_no_date": '''
+        on run argv
+            set reminderText to item 1 of argv
+            set listName to item 2 of argv
+
+            set usedDefaultList to false
+            tell application "Reminders"
+                try
+                    set targetList to list listName
+                on error
+                    set targetList to default list
+                    set usedDefaultList to true
+                end try
+
+                make new reminder at end of targetList with properties {name:reminderText}
+            end tell
+
+            if usedDefaultList then return "default list"
+            return ""
+        end run
+''',
+    # argv: reminder text, due date kind ("", "date" or "offset"), due value,
+    # notes, list name
+    "create_with_notes": '''
+        on run argv
+            set reminderText to item 1 of argv
+            set dueKind to item 2 of argv
+            set dueValue to item 3 of argv
+            set notesText to item 4 of argv
+            set listName to item 5 of argv
+
+            set usedDefaultList to false
+            tell application "Reminders"
+                try
+                    set targetList to list listName
+                on error
+                    set targetList to default list
+                    set usedDefaultList to true
+                end try
+
+                -- The notes go in the creation record, an empty body is no body
+                if dueKind is "offset" then
+                    set dueDateObj to (current date) + (dueValue as integer) * days
+                    make new reminder at end of targetList with properties {name:reminderText, body:notesText, due date:dueDateObj}
+                else if dueKind is "date" then
+                    try
+                        set dueDateObj to date dueValue
+                        make new reminder at end of targetList with properties {name:reminderText, body:notesText, due date:dueDateObj}
+                    on error errorMsg
+                        -- Fallback: create without date if date parsing fails
+                        make new reminder at end of targetList with properties {name:reminderText, body:notesText}
+                        log "Date parsing failed, created reminder without date: " & errorMsg
+                    end try
+                else
+                    make new reminder at end of targetList with properties {name:reminderText, body:notesText}
+                end if
+            end tell
+
+            if usedDefaultList then return "default list"
+            return ""
+        end run
+''',
+    # Default list name first, then every list name, so one call answers
+    # both the access test and get_reminder_lists
+    "probe": '''
+        on run argv
+            tell application "Reminders"
+                set listNames to {name of default list}
+                repeat with reminderList in lists
+                    set end of listNames to name of reminderList
+                end repeat
+            end tell
+
+            -- Unit separator, which can't appear in a list name
+            set AppleScript's text item delimiters to character id 31
+            return listNames as text
+        end run
+''',    # argv: progress file, list name, then reminder text, due date kind
+    # ("", "date" or "offset") and due date value per reminder; appends the
+    # index of each reminder to the progress file as it is created and
+    # returns the failures as "index:error" lines
+    "bulk_create": '''
+        on markCreated(progressPath, i)
+            try
+                set progressFile to open for access (POSIX file progressPath) with write permission
+                write ((i as text) & linefeed) to progressFile starting at eof
+                close access progressFile
+            end try
+        end markCreated
+
+        on run argv
+            set progressPath to item 1 of argv
+            set listName to item 2 of argv
+            set failures to {}
+
+            tell application "Reminders"
+                try
+                    set targetList to list listName
+                on error
+                    set targetList to default list
+                    set end of failures to "default list"
+                end try
+
+                repeat with i from 1 to ((count of argv) - 2) div 3
+                    set reminderText to item (i * 3) of argv
+                    set dueKind to item (i * 3 + 1) of argv
+                    set dueValue to item (i * 3 + 2) of argv
+                    try
+                        if dueKind is "offset" then
+                            set dueDateObj to (current date) + (dueValue as integer) * days
+                            make new reminder at end of targetList with properties {name:reminderText, due date:dueDateObj}
+                        else if dueKind is "date" then
+                            try
+                                set dueDateObj to date dueValue
+                                make new reminder at end of targetList with properties {name:reminderText, due date:dueDateObj}
+                            on error
+                                -- Fallback: create without date if date parsing fails
+                                make new reminder at end of targetList with properties {name:reminderText}
+                            end try
+                        else
+                            make new reminder at end of targetList with properties {name:reminderText}
+                        end if
+                        my markCreated(progressPath, i)
+                    on error errMsg
+                        set end of failures to (i as text) & ":" & errMsg
+                    end try
+                end repeat
+            end tell
+
+            set AppleScript's text item delimiters to linefeed
+            return failures as text
+        end run
+''',
+}
+
+
+# Relative due-date keywords resolved in Python to a day offset, in the
+# order they are checked
+_DUE_DATE_KEYWORDS = (("tomorrow", 1), ("next week", 7), ("today", 0))
+
+# Control characters (NUL included) deleted from reminder text in one
+# str.translate pass; tab and newline are kept
+_CONTROL_CHARS = dict.fromkeys(
+    [c for c in range(0x20) if chr(c) not in '\t\n'] + [0x7f])
+
+# A reminder identical to one created this recently is not created again
+_RECENT_WINDOW = 60.0
+_RECENT_SIZE = 512
+
+# Returned by the create scripts when the requested list didn't exist
+_DEFAULT_LIST_MARKER = "default list"
+
+# How long get_reminder_lists trusts its last answer
+_LISTS_CACHE_TTL = 30.0
+
+# Minimum timeout for a worker's first request, which pays for the driver
+# start, launching Reminders and the automation permission prompt
+_COLD_START_TIMEOUT = 30.0
+
+
+class _OsascriptWorker:
+    """A single osascript process reused for every AppleScript call, so each
+    call costs a pipe round-trip instead of a process spawn"""
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+        # Set once the current process has answered a request
+        self._warm = False
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ['osascript', '-l', 'JavaScript', '-e', _OSA_DRIVER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._warm = False
+
+    def _stop(self):
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def run(self, request, timeout=30):
+        """Send one driver request, returning (ok, output or error message)"""
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            if not self._warm:
+                timeout = max(timeout, _COLD_START_TIMEOUT)
+
+            try:
+                self._proc.stdin.write(json.dumps(request).encode() + b"\n")
+                self._proc.stdin.flush()
+            except OSError as e:
+                self._stop()
+                raise Exception(f"osascript worker is not running: {e}")
+
+            ready, _, _ = select.select([self._proc.stdout], [], [], timeout)
+            if not ready:
+                # The script may still be running, so don't reuse the process
+                self._stop()
+                raise subprocess.TimeoutExpired('osascript', timeout)
+
+            line = self._proc.stdout.readline()
+            if not line:
+                self._stop()
+                raise Exception("osascript worker exited unexpectedly")
+            self._warm = True
+
+        # json.loads takes the raw line, no separate decode pass
+        reply = json.loads(line)
+        if reply["ok"]:
+            return True, reply["out"]
+        return False, reply["err"]
+
+    def close(self):
+        """Terminate the osascript process"""
+        with self._lock:
+            if self._proc is not None:
+                self._proc.stdin.close()
+                try:
+                    self._proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self._proc.kill()
+                    self._proc.wait()
+                self._proc = None
+
+
+class _OsascriptPool:
+    """A few osascript workers handed out one caller at a time, so scripts
+    from different threads run side by side"""
+
+    def __init__(self, size=4):
+        self.size = size
+        self._workers = [_OsascriptWorker() for _ in range(size)]
+        self._idle = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def request(self, request, timeout=30):
+        """Send a driver request to the next idle worker"""
+        worker = self._idle.get()
+        try:
+            return worker.run(request, timeout)
+        finally:
+            self._idle.put(worker)
+
+    def run(self, script, timeout=30):
+        """Run an AppleScript source on the next idle worker"""
+        return self.request({"script": script}, timeout)
+
+    def close(self):
+        """Terminate every worker's osascript process"""
+        for worker in self._workers:
+            worker.close()
+
 
 class ReminderManager:
-    def __init__(self, default_list="Reminders"):
+    def __init__(self, default_list="Reminders", pool_size=4, script_timeout=5.0):
         self.default_list = default_list
 
+        # A warm osascript creates a reminder well under a second, so a
+        # script still running after this long is treated as hung
+        self.script_timeout = script_timeout
+
+        # Shared osascript processes, each started on its first call
+        self._osa = _OsascriptPool(pool_size)
+
+        # Template name -> driver request for it, resolved once here: the
+        # compiled .scpt path, or the source if it couldn't be compiled
+        self._script_requests = {
+            name: {"script": source} for name, source in _SCRIPT_SOURCES.items()}
+        self._compile_scripts()
+
+        # Reminder list names change rarely, so reuse them for a while
+        self._lists_cache = None
+        self._lists_cache_ts = 0.0
+        self._access_result = None
+
+        # Read name -> [Event, result] for a probe already in flight, so
+        # concurrent callers share one osascript call instead of each running it
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # (display text, due date, list) -> monotonic time it was created
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Stop the osascript processes"""
+        self._osa.close()
+
+    def _compile_scripts(self):
+        """Compile each fixed script to the cache dir unless this version of
+        it is already there"""
+        try:
+            os.makedirs(_SCRIPT_CACHE_DIR, exist_ok=True)
+        except OSError as e:
+            logging.warning("Could not create script cache dir: %s", e)
+            return
+
+        for name, source in _SCRIPT_SOURCES.items():
+            digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+            path = os.path.join(_SCRIPT_CACHE_DIR, f"{name}-{digest}.scpt")
+            try:
+                if not os.path.exists(path):
+                    tmp_path = os.path.join(
+                        _SCRIPT_CACHE_DIR, f"{name}-{digest}.{os.getpid()}.scpt")
+                    result = subprocess.run(
+                        ['osacompile', '-o', tmp_path, '-e', source],
+                        capture_output=True,
+                        timeout=30
+                    )
+                    if result.returncode != 0:
+                        # stderr is only decoded when there's an error to show
+                        raise Exception(
+                            result.stderr.decode('utf-8', 'replace').strip())
+                    os.replace(tmp_path, path)
+                self._script_requests[name] = {"path": path}
+            except Exception as e:
+                # Still works from source, just compiled on every call
+                logging.warning("Could not compile %s script: %s", name, e)
+
+    def invalidate_lists_cache(self):
+        """Forget the cached reminder list names"""
+        self._lists_cache = None
+
+    def _check_default_list_fallback(self, output):
+        """A list we were asked for is missing, so the cached names are stale"""
+        if _DEFAULT_LIST_MARKER in output.splitlines():
+            self.invalidate_lists_cache()
+
+    def _dedupe_key(self, reminder_data, target_list):
+        """Key identifying a reminder for duplicate detection"""
+        if len(reminder_data) == 2:
+            reminder_text, due_date = reminder_data
+            source_info = ""
+        else:
+            reminder_text, due_date, source_info = reminder_data
+        return (self._compose_display_text(reminder_text, source_info), due_date or '', target_list)
+
+    def _is_recent(self, key):
+        """Whether this reminder was created within the last _RECENT_WINDOW"""
+        with self._recent_lock:
+            created_at = self._recent.get(key)
+            return created_at is not None and time.monotonic() - created_at < _RECENT_WINDOW
+
+    def _remember(self, key):
+        """Record a created reminder, dropping the oldest past _RECENT_SIZE"""
+        with self._recent_lock:
+            self._recent[key] = time.monotonic()
+            self._recent.move_to_end(key)
+            if len(self._recent) > _RECENT_SIZE:
+                self._recent.popitem(last=False)
+
+    def _single_flight(self, key, fetch):
+        """Run fetch() once for all concurrent callers of the same key"""
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = [threading.Event(), None]
+
+        if not leader:
+            flight[0].wait()
+            return flight[1]
+
+        try:
+            flight[1] = fetch()
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight[0].set()
+        return flight[1]
+
+    def _run_script(self, name, args=(), timeout=None):
+        """Run one of the fixed scripts with the given argv"""
+        request = dict(self._script_requests[name], args=args)
+        return self._osa.request(request, timeout or self.script_timeout)
+
     def create_reminder(self, reminder_data, reminder_list=None):
-        """Create a reminder with improved error handling and validation"""
+        """Create a reminder with improved error handling and validation
+
+        Returns True once created, or False if it duplicates a reminder
+        created within the last _RECENT_WINDOW and was skipped.
+        """
         try:
             if len(reminder_data) == 2:
                 reminder_text, due_date = reminder_data
@@ -18,53 +521,79 @@ class ReminderManager:
             else:
                 reminder_text, due_date, source_info = reminder_data
 
-            # Clean and validate reminder text
-            reminder_text = self._clean_reminder_text(reminder_text)
+            # Clean and validate reminder text, with its source
+            reminder_text = self._compose_display_text(
+                reminder_text, source_info)
             target_list = reminder_list or self.default_list
 
-            # Build AppleScript command based on due date
+            key = (reminder_text, due_date or '', target_list)
+            if self._is_recent(key):
+                logging.info(
+                    "Skipping duplicate reminder: %.50s...", reminder_text)
+                return False
+
+            # Pick the AppleScript based on due date
             if due_date and due_date.strip().lower() != 'missing value':
-                applescript_cmd = self._build_applescript_with_date(
-                    reminder_text, due_date, target_list, source_info
-                )
+                due_kind, due_value = self._due_date_args(due_date)
+                script = "create_with_day_offset" if due_kind == "offset" else "create_with_date"
+                ok, output = self._run_script(
+                    script, (reminder_text, due_value, target_list))
             else:
-                applescript_cmd = self._build_applescript_no_date(
-                    reminder_text, target_list, source_info
-                )
-
-            # Execute the AppleScript
-            result = subprocess.run(
-                ['osascript', '-e', applescript_cmd],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown AppleScript error"
+                ok, output = self._run_script(
+                    "create_no_date", (reminder_text, target_list))
+
+            if not ok:
+                error_msg = output.strip() if output else "Unknown AppleScript error"
                 raise Exception(f"AppleScript execution failed: {error_msg}")
+            self._check_default_list_fallback(output)
+            self._remember(key)
 
             logging.info(
-                f"Successfully created reminder: {reminder_text[:50]}... (Due: {due_date if due_date else 'Not specified'})")
+                "Successfully created reminder: %.50s... (Due: %s)",
+                reminder_text, due_date or 'Not specified')
             return True
 
         except subprocess.TimeoutExpired:
             raise Exception("Reminder creation timed out")
         except Exception as e:
-            logging.error(f"Error creating reminder: {e}")
+            logging.error("Error creating reminder: %s", e)
             raise
 
+    async def create_reminder_async(self, reminder_data, reminder_list=None):
+        """Async variant of create_reminder for use with asyncio.gather"""
+        # The pooled osascript workers already run scripts side by side, so
+        # wait for one on a thread rather than spawning a process per call
+        return await asyncio.to_thread(
+            self.create_reminder, reminder_data, reminder_list)
+
+    def _due_date_args(self, due_date):
+        """Split a due date into ("date", date string) or ("offset", days)"""
+        due_date = due_date.strip()
+
+        # AppleScript date expression, e.g. date "10/15/2025 05:00 PM"
+        if due_date.startswith('date '):
+            return "date", due_date[5:].strip().strip('"')
+
+        lowered = due_date.lower()
+        for keyword, days in _DUE_DATE_KEYWORDS:
+            if keyword in lowered:
+                return "offset", str(days)
+
+        # Let AppleScript try to read it as a date string
+        return "date", due_date
+
+    def _compose_display_text(self, reminder_text, source_info=""):
+        """Add the source to the reminder text, then clean the result once"""
+        if source_info:
+            reminder_text = f"{reminder_text or 'Follow up on message'} (from {source_info})"
+        return self._clean_reminder_text(reminder_text)
+
     def _clean_reminder_text(self, text):
         """Clean reminder text for AppleScript compatibility"""
         if not text:
             return "Follow up on message"
 
-        # Escape quotes and backslashes for AppleScript
-        text = text.replace('\\', '\\\\')
-        text = text.replace('"', '\\"')
-
-        # Remove any problematic characters
-        text = re.sub(r'[^\w\s\-.,!?:;()\[\]/@#$%&*+=<>]', '', text)
+        text = text.translate(_CONTROL_CHARS)
 
         # Ensure reasonable length
         if len(text) > 200:
@@ -72,210 +601,241 @@ class ReminderManager:
 
         return text.strip()
 
-    def _build_applescript_with_date(self, reminder_text, due_date, reminder_list, source_info=""):
-        """Build AppleScript command with due date"""
-        # Add source information to the reminder text if available
-        if source_info:
-            reminder_text = f"{reminder_text} (from {source_info})"
-
-        return f'''
-        tell application "Reminders"
-            try
-                set targetList to list "{reminder_list}"
-            on error
-                set targetList to default list
-            end try
-            
-            try
-                if "{due_date}" contains "date" then
-                    set dueDateStr to "{due_date}"
-                    set dueDateObj to run script dueDateStr
-                    make new reminder at end of targetList with properties {{name:"{reminder_text}", due date:dueDateObj}}
-                else
-                    -- Parse custom date format
-                    set dueDateObj to my parseCustomDate("{due_date}")
-                    make new reminder at end of targetList with properties {{name:"{reminder_text}", due date:dueDateObj}}
-                end if
-            on error errorMsg
-                -- Fallback: create without date if date parsing fails
-                make new reminder at end of targetList with properties {{name:"{reminder_text}"}}
-                log "Date parsing failed, created reminder without date: " & errorMsg
-            end try
-        end tell
-        
-        on parseCustomDate(dateStr)
-            -- Custom date parsing logic for various formats
-            set currentDate to current date
-            
-            if dateStr contains "tomorrow" then
-                return currentDate + 1 * days
-            else if dateStr contains "next week" then
-                return currentDate + 7 * days
-            else if dateStr contains "today" then
-                return currentDate
-            else
-                -- Try to parse as date string
-                try
-                    return date dateStr
-                on error
-                    return currentDate + 1 * days
-                end try
-            end if
-        end parseCustomDate
-        '''
-
-    def _build_applescript_no_date(self, reminder_text, reminder_list, source_info=""):
-        """Build AppleScript command without due date"""
-        # Add source information to the reminder text if available
-        if source_info:
-            reminder_text = f"{reminder_text} (from {source_info})"
-
-        return f'''
-        tell application "Reminders"
-            try
-                set targetList to list "{reminder_list}"
-            on error
-                set targetList to default list
-            end try
-            
-            make new reminder at end of targetList with properties {{name:"{reminder_text}"}}
-        end tell
-        '''
-
     def get_reminder_lists(self):
-        """Get available reminder lists"""
-        try:
-            applescript_cmd = '''
-            tell application "Reminders"
-                set listNames to {}
-                repeat with reminderList in lists
-                    set end of listNames to name of reminderList
-                end repeat
-                return listNames
-            end tell
-            '''
-
-            result = subprocess.run(
-                ['osascript', '-e', applescript_cmd],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                # Parse the returned list
-                lists_str = result.stdout.strip()
-                if lists_str:
-                    # AppleScript returns comma-separated values
-                    lists = [list_name.strip()
-                             for list_name in lists_str.split(',')]
-                    return lists
-
-            return ["Reminders"]  # Default fallback
+        """Get available reminder lists, cached for a short while"""
+        if not self._lists_fresh():
+            ok, message = self._single_flight("probe", self._probe)
+            if not ok:
+                logging.error("Error getting reminder lists: %s", message)
+
+        if self._lists_cache:
+            return list(self._lists_cache)
+        return ["Reminders"]  # Default fallback
+
+    def _lists_fresh(self):
+        """Whether the cached list names are younger than _LISTS_CACHE_TTL"""
+        return self._lists_cache is not None and time.monotonic() - self._lists_cache_ts < _LISTS_CACHE_TTL
+
+    def _probe(self):
+        """Fetch the default list name and every list name in one call
+
+        Refreshes the lists cache and remembers a successful access test.
+        Returns the (ok, message) pair test_reminders_access reports.
+        """
+        # Checked here, under the single flight, so a caller arriving just as
+        # the previous probe finished reuses its result
+        if self._access_result is not None and self._lists_fresh():
+            return self._access_result
 
+        try:
+            ok, output = self._run_script(
+                "probe", timeout=_COLD_START_TIMEOUT)
         except Exception as e:
-            logging.error(f"Error getting reminder lists: {e}")
-            return ["Reminders"]
+            return False, f"Error testing Reminders access: {e}"
+
+        if not ok:
+            return False, f"Failed to connect to Reminders app: {output}"
+
+        # Names are joined with \x1f, so commas in them survive
+        default_name, *lists = output.rstrip('\n').split('\x1f')
+        if lists:
+            self._lists_cache = lists
+            self._lists_cache_ts = time.monotonic()
+        self._access_result = (
+            True, f"Successfully connected to Reminders app. Default list: {default_name}")
+        return self._access_result
 
     def create_reminder_with_notes(self, reminder_text, due_date=None, notes="", reminder_list=None):
         """Create a reminder with additional notes"""
         try:
             target_list = reminder_list or self.default_list
             reminder_text = self._clean_reminder_text(reminder_text)
-            notes = self._clean_reminder_text(notes) if notes else ""
+            # Notes are the reminder body, so keep their full length
+            notes = notes.translate(_CONTROL_CHARS) if notes else ""
 
+            # Same date handling as create_reminder: keywords become a day
+            # offset, anything else is read with AppleScript's date
             if due_date and due_date.strip().lower() != 'missing value':
-                applescript_cmd = f'''
-                tell application "Reminders"
-                    try
-                        set targetList to list "{target_list}"
-                    on error
-                        set targetList to default list
-                    end try
-                    
-                    set dueDateObj to {due_date}
-                    set newReminder to make new reminder at end of targetList with properties {{name:"{reminder_text}", due date:dueDateObj}}
-                    
-                    if "{notes}" is not "" then
-                        set body of newReminder to "{notes}"
-                    end if
-                end tell
-                '''
+                due_kind, due_value = self._due_date_args(due_date)
             else:
-                applescript_cmd = f'''
-                tell application "Reminders"
-                    try
-                        set targetList to list "{target_list}"
-                    on error
-                        set targetList to default list
-                    end try
-                    
-                    set newReminder to make new reminder at end of targetList with properties {{name:"{reminder_text}"}}
-                    
-                    if "{notes}" is not "" then
-                        set body of newReminder to "{notes}"
-                    end if
-                end tell
-                '''
-
-            result = subprocess.run(
-                ['osascript', '-e', applescript_cmd],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown AppleScript error"
+                due_kind, due_value = "", ""
+
+            ok, output = self._run_script(
+                "create_with_notes",
+                (reminder_text, due_kind, due_value, notes, target_list))
+
+            if not ok:
+                error_msg = output.strip() if output else "Unknown AppleScript error"
                 raise Exception(f"AppleScript execution failed: {error_msg}")
+            self._check_default_list_fallback(output)
 
             logging.info(
-                f"Created reminder with notes: {reminder_text[:30]}...")
+                "Created reminder with notes: %.30s...", reminder_text)
             return True
 
         except Exception as e:
-            logging.error(f"Error creating reminder with notes: {e}")
+            logging.error("Error creating reminder with notes: %s", e)
             raise
 
     def test_reminders_access(self):
-        """Test if we can access the Reminders app"""
-        try:
-            applescript_cmd = '''
-            tell application "Reminders"
-                return name of default list
-            end tell
-            '''
+        """Test if we can access the Reminders app (a success is remembered)"""
+        if self._access_result is not None:
+            return self._access_result
+        return self._single_flight("probe", self._probe)
+
+    def _bulk_args(self, reminders_list, reminder_list):
+        """Flatten reminders into the bulk_create script's argv"""
+        args = [reminder_list]
+        for reminder_data in reminders_list:
+            if len(reminder_data) == 2:
+                reminder_text, due_date = reminder_data
+                source_info = ""
+            else:
+                reminder_text, due_date, source_info = reminder_data
 
-            result = subprocess.run(
-                ['osascript', '-e', applescript_cmd],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            reminder_text = self._compose_display_text(
+                reminder_text, source_info)
 
-            if result.returncode == 0:
-                return True, f"Successfully connected to Reminders app. Default list: {result.stdout.strip()}"
+            if not due_date or due_date.strip().lower() == 'missing value':
+                args.extend((reminder_text, "", ""))
             else:
-                return False, f"Failed to connect to Reminders app: {result.stderr}"
-
-        except Exception as e:
-            return False, f"Error testing Reminders access: {e}"
+                args.extend((reminder_text, *self._due_date_args(due_date)))
+        return args
 
     def bulk_create_reminders(self, reminders_list, reminder_list=None):
-        """Create multiple reminders efficiently"""
+        """Create multiple reminders efficiently, split into one AppleScript
+        call per pooled osascript worker and run in parallel
+
+        Returns (created, skipped, failed): the texts of the reminders
+        created, the texts of duplicates not sent again, and a
+        (text, error) pair for each reminder that failed.
+        """
         target_list = reminder_list or self.default_list
-        created_count = 0
-        errors = []
+        pending, skipped = self._split_duplicates(reminders_list, target_list)
+        if not pending:
+            return [], skipped, []
+
+        chunk_size = -(-len(pending) // self._osa.size)
+        chunks = [pending[i:i+chunk_size]
+                  for i in range(0, len(pending), chunk_size)]
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(
+                lambda chunk: self._bulk_create_chunk(chunk, target_list), chunks))
+
+        created = [text for chunk_created, _ in results for text in chunk_created]
+        failed = [item for _, chunk_failed in results for item in chunk_failed]
 
+        logging.info(
+            "Created %d of %d reminders in %d AppleScript call(s), skipped %d duplicate(s), %d failed",
+            len(created), len(reminders_list), len(chunks), len(skipped), len(failed))
+        return created, skipped, failed
+
+    async def bulk_create_reminders_async(self, reminders_list, reminder_list=None):
+        """Submit every reminder at once and collect the results afterwards,
+        returned as bulk_create_reminders does"""
+        target_list = reminder_list or self.default_list
+        pending, skipped = self._split_duplicates(reminders_list, target_list)
+        results = await asyncio.gather(
+            *(self.create_reminder_async(reminder_data, target_list)
+              for _, reminder_data in pending),
+            return_exceptions=True
+        )
+
+        created = []
+        failed = []
+        for (_, reminder_data), result in zip(pending, results):
+            if isinstance(result, Exception):
+                failed.append((reminder_data[0], str(result)))
+            elif result:
+                created.append(reminder_data[0])
+            else:
+                # Created by another caller since the split
+                skipped.append(reminder_data[0])
+        return created, skipped, failed
+
+    def _split_duplicates(self, reminders_list, target_list):
+        """Split reminders into (dedupe key, reminder) pairs to create and
+        the texts of duplicates, within the batch or of a recent reminder,
+        to skip"""
+        pending = []
+        skipped = []
+        seen = set()
         for reminder_data in reminders_list:
+            key = self._dedupe_key(reminder_data, target_list)
+            if key not in seen and not self._is_recent(key):
+                seen.add(key)
+                pending.append((key, reminder_data))
+            else:
+                skipped.append(reminder_data[0])
+        return pending, skipped
+
+    def _bulk_create_chunk(self, chunk, target_list):
+        """Create a chunk of (dedupe key, reminder) pairs in a single
+        AppleScript call, returning (created texts, (text, error) pairs)"""
+        reminders_list = [reminder_data for _, reminder_data in chunk]
+        texts = [reminder_data[0] for reminder_data in reminders_list]
+
+        # The script logs each reminder it creates here, so a call that
+        # times out or dies partway still tells which ones exist
+        fd, progress_path = tempfile.mkstemp(prefix="bulk-", suffix=".progress")
+        os.close(fd)
+        try:
             try:
-                self.create_reminder(reminder_data, target_list)
-                created_count += 1
+                # One script_timeout per item; a chunk that overruns only fails
+                # its own items, the others keep going on their own workers
+                ok, output = self._run_script(
+                    "bulk_create",
+                    [progress_path] + self._bulk_args(reminders_list, target_list),
+                    timeout=self.script_timeout * len(reminders_list))
+                if not ok:
+                    raise Exception(
+                        f"AppleScript execution failed: {output.strip() if output else 'Unknown AppleScript error'}")
+            except subprocess.TimeoutExpired:
+                return self._split_by_progress(
+                    chunk, texts, progress_path, "Reminder creation timed out")
             except Exception as e:
-                errors.append(f"Failed to create reminder: {str(e)}")
-
-        return created_count, errors
+                logging.error("Error creating reminders: %s", e)
+                return self._split_by_progress(chunk, texts, progress_path, str(e))
+        finally:
+            os.remove(progress_path)
+
+        self._check_default_list_fallback(output)
+
+        errors = {}
+        for line in output.splitlines():
+            index, sep, error_msg = line.partition(':')
+            if sep and index.isdigit():
+                errors[int(index)] = error_msg
+
+        created = []
+        failed = []
+        for i, (key, _) in enumerate(chunk, start=1):
+            if i in errors:
+                failed.append((texts[i - 1], errors[i]))
+            else:
+                self._remember(key)
+                created.append(texts[i - 1])
+        return created, failed
 
+    def _split_by_progress(self, chunk, texts, progress_path, error_msg):
+        """Sort a chunk whose call failed into the reminders its progress
+        file lists as created and the rest, failed with error_msg"""
+        try:
+            with open(progress_path) as f:
+                done = {int(line) for line in f if line.strip().isdigit()}
+        except OSError:
+            done = set()
+
+        created = []
+        failed = []
+        for i, (key, _) in enumerate(chunk, start=1):
+            if i in done:
+                self._remember(key)
+                created.append(texts[i - 1])
+            else:
+                failed.append((texts[i - 1], error_msg))
+        return created, failed
 
 # import subprocess
 # import logging
@@ -3,14 +3,166 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import font as tkFont
 import logging
-import time
+import os
+import threading
+import uuid
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import re
-from database import MessageDB
-from llm import GeminiLLM
+from functools import cached_property, lru_cache
+from database import MessageDB, normalize_phone
+from llm import GeminiLLM, UNANSWERED
+from llm_cache import MISS, LLMCache, cache_key
 from reminder import ReminderManager
 
+# Gemini calls spend nearly all their time waiting on the network, so
+# several messages are processed at once
+_LLM_WORKERS = 8
+
+# Token bucket in front of the Gemini API: at most _LLM_BURST calls start
+# within any _LLM_REFILL seconds
+_LLM_BURST = 8
+_LLM_REFILL = 1.0
+
+# Messages sent to Gemini in one prompt
+_LLM_BATCH_SIZE = 20
+
+# Auto-refresh polls every 30 s while chat.db is changing, doubling the
+# wait up to 5 min once it has sat unchanged for a few polls
+_REFRESH_INTERVAL_MS = 30000
+_REFRESH_MAX_INTERVAL_MS = 300000
+_REFRESH_IDLE_POLLS = 3
+
+# Lines kept in the History tab; older ones are dropped from the top
+_HISTORY_MAX_LINES = 1000
+
+# The current time as the status bar and History tab show it, reformatted
+# once a second by ReminderUI._tick_clock rather than on every update
+_now_hms = [""]
+_now_full = [""]
+
+# Staged reminder rows kept alive and rebound as the list scrolls, far more
+# than ever fit in the viewport at once
+_STAGED_POOL_SIZE = 20
+_STAGED_ROW_GAP = 10
+
+
+def _column(df, name, default="Unknown"):
+    """A DataFrame column, or default for every row if it is absent"""
+    if name in df:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
+class _StagedRow:
+    """One reusable staged reminder widget, rebound to whichever reminder
+    is scrolled into its slot"""
+
+    def __init__(self, ui, canvas):
+        self.reminder_id = None
+        self.reminder = None
+
+        # Main frame for this reminder
+        self.frame = ttk.LabelFrame(canvas, text="Reminder", padding=10)
+
+        # Original message display
+        orig_frame = ttk.Frame(self.frame)
+        orig_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(orig_frame, text="Original Message:",
+                  font=ui._font_bold_9).pack(anchor=tk.W)
+        self.orig_text = tk.Text(orig_frame, height=2,
+                                 wrap=tk.WORD, font=ui._font_reg_9)
+        self.orig_text.config(state='disabled', bg='#f0f0f0')
+        self.orig_text.pack(fill=tk.X, pady=(2, 0))
+
+        # Editable reminder text
+        reminder_edit_frame = ttk.Frame(self.frame)
+        reminder_edit_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(reminder_edit_frame, text="Reminder Text:",
+                  font=ui._font_bold_9).pack(anchor=tk.W)
+        self.reminder_text_var = tk.StringVar()
+        ttk.Entry(reminder_edit_frame, textvariable=self.reminder_text_var,
+                  font=ui._font_reg_10).pack(fill=tk.X, pady=(2, 0))
+
+        # Due date editing
+        date_frame = ttk.Frame(self.frame)
+        date_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(date_frame, text="Due Date:",
+                  font=ui._font_bold_9).pack(side=tk.LEFT)
+
+        self.due_date_var = tk.StringVar()
+        ttk.Entry(date_frame, textvariable=self.due_date_var,
+                  width=20).pack(side=tk.LEFT, padx=(10, 5))
+
+        # Quick date buttons, set from the strings computed at each refresh
+        for i, label in enumerate(("Today", "Tomorrow", "Next Week")):
+            ttk.Button(date_frame, text=label,
+                       command=lambda i=i: self.due_date_var.set(ui._quick_dates[i])).pack(side=tk.LEFT, padx=2)
+
+        # Action buttons
+        action_frame = ttk.Frame(self.frame)
+        action_frame.pack(fill=tk.X)
+
+        # Create individual reminder button
+        ttk.Button(action_frame, text="✅ Create This Reminder",
+                   command=lambda: ui.create_individual_reminder(self.reminder_id),
+                   style='Success.TButton').pack(side=tk.LEFT, padx=(0, 5))
+
+        # Remove reminder button
+        ttk.Button(action_frame, text="❌ Remove",
+                   command=lambda: ui.remove_staged_reminder(self.reminder_id),
+                   style='Danger.TButton').pack(side=tk.LEFT)
+
+        # Info label
+        self.info_label = ttk.Label(action_frame, font=ui._font_small,
+                                    foreground='gray')
+        self.info_label.pack(side=tk.RIGHT)
+
+        # Edits go straight into the bound reminder, so nothing is lost
+        # when the row is rebound on scroll
+        self.reminder_text_var.trace_add('write', self._store)
+        self.due_date_var.trace_add('write', self._store)
+
+        self.window = canvas.create_window(
+            0, 0, window=self.frame, anchor="nw", state='hidden')
+
+    def bind_to(self, reminder):
+        """Show a staged reminder in this row"""
+        if reminder is self.reminder:
+            return
+
+        # Unbound while filling in, so the traces don't write back
+        self.reminder = None
+        self.frame.config(text=f"Reminder from {reminder['contact_name']}")
+
+        self.orig_text.config(state='normal')
+        self.orig_text.delete('1.0', tk.END)
+        self.orig_text.insert('1.0', reminder['original_text'])
+        self.orig_text.config(state='disabled')
+
+        self.reminder_text_var.set(reminder['reminder_text'])
+        self.due_date_var.set(
+            reminder['due_date'] if reminder['due_date'] != 'missing value' else '')
+        self.info_label.config(
+            text=f"From: {reminder['sender']} | Created: {reminder['created_at'].strftime('%H:%M:%S')}")
+        self.reminder_id = reminder['id']
+        self.reminder = reminder
+
+    def unbind(self):
+        """Detach this row from any reminder"""
+        self.reminder_id = None
+        self.reminder = None
+
+    def _store(self, *args):
+        """Update the reminder data when values change"""
+        if self.reminder is None:
+            return
+        self.reminder['reminder_text'] = self.reminder_text_var.get()
+        self.reminder['due_date'] = self.due_date_var.get() or 'missing value'
+
 
 class ReminderUI:
     def __init__(self, root):
@@ -19,36 +171,121 @@ class ReminderUI:
         self.root.geometry("1000x700")
         self.root.configure(bg='#f0f0f0')
 
+        # Start the clock before anything logs to the history
+        self._clock_handle = None
+        self._tick_clock()
+
         # Configure styles
         self.setup_styles()
 
-        # Initialize components
-        self.db = MessageDB()
-        self.llm = GeminiLLM()
-        self.rm = ReminderManager()
+        # Fonts shared by every staged reminder row, resolved by Tk once
+        self._font_bold_9 = tkFont.Font(
+            family='Helvetica', size=9, weight='bold')
+        self._font_reg_9 = tkFont.Font(family='Helvetica', size=9)
+        self._font_reg_10 = tkFont.Font(family='Helvetica', size=10)
+        self._font_small = tkFont.Font(family='Helvetica', size=8)
+
+        # Initialize components; the database, LLM and Reminders manager
+        # are built on first use (see the cached properties below)
+        self._init_lock = threading.Lock()
+        self.llm_cache = LLMCache()
 
         # Storage for staged reminders
         self.staged_reminders = []
 
+        # Message processing runs off the Tk thread; results come back
+        # through root.after
+        self._llm_pool = ThreadPoolExecutor(
+            max_workers=_LLM_WORKERS, thread_name_prefix="llm")
+        self._llm_tokens = threading.BoundedSemaphore(_LLM_BURST)
+
+        # Refreshes read chat.db here, one at a time, off the Tk thread
+        self._db_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db")
+
         # Create main interface
         self.create_main_interface()
 
-        # Auto-refresh every 30 seconds
+        # Auto-refresh every 30 seconds, less often while nothing changes
+        self._seen_db_mtime = None
+        self._refreshed_db_mtime = None
+        self._idle_polls = 0
+        self._refresh_interval = _REFRESH_INTERVAL_MS
+        self._was_visible = True
+        self._refresh_handle = None
+        self._refresh_in_flight = False
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
         self.auto_refresh()
 
+        # Get the slow components ready before the first Process click
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _init_once(self, name, factory):
+        """Build a lazy component once, even when two threads race for it"""
+        # cached_property itself takes no lock, so the value is stored here
+        # under ours before it is returned
+        with self._init_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = factory()
+            return self.__dict__[name]
+
+    @cached_property
+    def db(self):
+        return self._init_once('db', MessageDB)
+
+    @cached_property
+    def llm(self):
+        return self._init_once('llm', lambda: GeminiLLM(cache=self.llm_cache))
+
+    @cached_property
+    def rm(self):
+        return self._init_once('rm', ReminderManager)
+
+    def _warm_up(self):
+        """Initialize the Gemini client and the Reminders scripts"""
+        try:
+            self.llm
+            self.rm
+        except Exception as e:
+            logging.error(f"Failed to initialize components: {e}")
+
+    def close(self):
+        """Stop background work and release the database and osascript"""
+        self._cancel_timers()
+        self._llm_pool.shutdown(wait=False, cancel_futures=True)
+        self._db_pool.shutdown(wait=False, cancel_futures=True)
+        self.llm_cache.close()
+
+        # Only the components that were ever built
+        for name in ('llm', 'db', 'rm'):
+            component = self.__dict__.get(name)
+            if component is not None:
+                component.close()
+
     def setup_styles(self):
         """Configure custom styles for the application"""
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+        self.style = ttk.Style(self.root)
+        self._configure_styles(self.style)
+
+    @staticmethod
+    def _configure_styles(style):
+        """Apply the theme and custom styles, unless this root's Tcl
+        interpreter already has them"""
+        # ttk styles live in the interpreter, so each new Tk root needs
+        # them set again while a second UI on the same root doesn't
+        if style.lookup('Title.TLabel', 'font'):
+            return
+
+        style.theme_use('clam')
 
         # Configure custom styles
-        self.style.configure('Title.TLabel', font=(
+        style.configure('Title.TLabel', font=(
             'Helvetica', 16, 'bold'), background='#f0f0f0')
-        self.style.configure('Header.TLabel', font=(
+        style.configure('Header.TLabel', font=(
             'Helvetica', 12, 'bold'), background='#f0f0f0')
-        self.style.configure('Success.TButton', background='#4CAF50')
-        self.style.configure('Warning.TButton', background='#FF9800')
-        self.style.configure('Danger.TButton', background='#f44336')
+        style.configure('Success.TButton', background='#4CAF50')
+        style.configure('Warning.TButton', background='#FF9800')
+        style.configure('Danger.TButton', background='#f44336')
 
     def create_main_interface(self):
         """Create the main application interface"""
@@ -162,7 +399,7 @@ class ReminderUI:
         self.messages_tree.column('Status', width=100)
 
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(
+        self.messages_v_scrollbar = v_scrollbar = ttk.Scrollbar(
             list_frame, orient=tk.VERTICAL, command=self.messages_tree.yview)
         h_scrollbar = ttk.Scrollbar(
             list_frame, orient=tk.HORIZONTAL, command=self.messages_tree.xview)
@@ -192,28 +429,28 @@ class ReminderUI:
         staged_list_frame = ttk.Frame(self.staged_frame)
         staged_list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        # Create frame for staged reminders with scrolling
-        canvas = tk.Canvas(staged_list_frame, bg='white')
-        scrollbar_staged = ttk.Scrollbar(
+        # Only a pool of rows exists; they are placed on the canvas where
+        # the reminders in view would be and rebound as it scrolls
+        self.staged_canvas = canvas = tk.Canvas(staged_list_frame, bg='white')
+        self._row_height = None
+        self.staged_scrollbar = ttk.Scrollbar(
             staged_list_frame, orient="vertical", command=canvas.yview)
-        self.staged_scrollable_frame = ttk.Frame(canvas)
+        canvas.configure(yscrollcommand=self._on_staged_scroll)
 
-        self.staged_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        canvas.pack(side="left", fill="both", expand=True)
+        self.staged_scrollbar.pack(side="right", fill="y")
 
-        canvas.create_window(
-            (0, 0), window=self.staged_scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar_staged.set)
+        self._row_pool = [_StagedRow(self, canvas)
+                          for _ in range(_STAGED_POOL_SIZE)]
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar_staged.pack(side="right", fill="y")
+        canvas.bind("<Configure>", lambda e: self.refresh_staged_reminders_display())
 
         # Bind mousewheel to canvas
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind("<MouseWheel>", _on_mousewheel)
+        for row in self._row_pool:
+            row.frame.bind("<MouseWheel>", _on_mousewheel)
 
     def create_history_tab(self):
         """Create the history tab"""
@@ -243,29 +480,38 @@ class ReminderUI:
     def update_status(self, message):
         """Update the status bar message"""
         self.status_bar.config(
-            text=f"{datetime.now().strftime('%H:%M:%S')} - {message}")
+            text=f"{_now_hms[0]} - {message}")
         self.root.update_idletasks()
 
     def add_to_history(self, message):
         """Add a message to the history log"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = _now_full[0]
         self.history_text.insert(tk.END, f"[{timestamp}] {message}\n")
+
+        # The last line is the empty one after the final newline
+        lines = int(self.history_text.index('end-1c').split('.')[0]) - 1
+        if lines > _HISTORY_MAX_LINES:
+            self.history_text.delete(
+                '1.0', f"{lines - _HISTORY_MAX_LINES + 1}.0")
         self.history_text.see(tk.END)
 
-    def resolve_contact_name(self, phone_or_email):
-        """Resolve phone number or email to contact name"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def resolve_contact_name(phone_or_email):
+        """Resolve phone number or email to contact name (cached per input)"""
         # This is a simplified version - you might want to integrate with
         # the Contacts app or maintain your own contact database
         try:
             # Remove formatting from phone numbers
-            clean_number = re.sub(r'[^\d+]', '', str(phone_or_email))
+            clean_number = normalize_phone(str(phone_or_email))
 
             # You could add logic here to query the Contacts database
             # For now, we'll just clean up the display
             if '@' in str(phone_or_email):
                 return phone_or_email  # It's an email
-            elif len(clean_number) >= 10:
-                # Format phone number nicely
+            elif '+' not in str(phone_or_email) and len(clean_number) >= 10:
+                # Format phone number nicely, leaving international forms as
+                # they are
                 if len(clean_number) == 10:
                     return f"({clean_number[:3]}) {clean_number[3:6]}-{clean_number[6:]}"
                 elif len(clean_number) == 11 and clean_number[0] == '1':
@@ -275,34 +521,69 @@ class ReminderUI:
         except:
             return phone_or_email
 
-    def refresh_data(self):
-        """Refresh the messages display"""
+    def refresh_data(self, quiet=False, db_mtime=None):
+        """Refresh the messages display
+
+        The query runs on the database pool; the tree is filled in once it
+        finishes. quiet reports errors in the status bar only. db_mtime, the
+        chat.db modification time the refresh reads, is recorded once it
+        succeeds so auto-refresh knows the display is current.
+        """
+        # One refresh at a time; the one already running will show the data
+        if self._refresh_in_flight:
+            return
+        self._refresh_in_flight = True
+
         self.update_status("Refreshing data...")
+        future = self._db_pool.submit(self.db.get_unread_imessages)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_refresh_done, f, quiet, db_mtime))
+
+    def _on_refresh_done(self, future, quiet, db_mtime=None):
+        """Show the result of a background refresh (Tk thread)"""
+        self._refresh_in_flight = False
         try:
-            df = self.db.get_unread_imessages()
+            df = future.result()
             self.populate_messages_tree(df)
+            if db_mtime is not None:
+                self._refreshed_db_mtime = db_mtime
             self.update_stats(len(df))
             self.update_status("Data refreshed successfully")
             self.add_to_history(
                 f"Refreshed data - {len(df)} unread messages found")
         except Exception as e:
             self.update_status(f"Error refreshing data: {str(e)}")
-            messagebox.showerror("Error", f"Failed to refresh data: {str(e)}")
+            if not quiet:
+                messagebox.showerror(
+                    "Error", f"Failed to refresh data: {str(e)}")
 
     def populate_messages_tree(self, df):
         """Populate the messages tree view"""
-        # Clear existing items
-        for item in self.messages_tree.get_children():
-            self.messages_tree.delete(item)
+        # Clear existing items in one call
+        self.messages_tree.delete(*self.messages_tree.get_children())
 
-        for _, row in df.iterrows():
-            sender = self.resolve_contact_name(row.get("sender", "Unknown"))
-            message_preview = (
-                row["text"][:50] + "...") if len(row["text"]) > 50 else row["text"]
-            date_str = row.get("sent_date", "Unknown")
+        if df.empty:
+            return
 
-            self.messages_tree.insert('', tk.END, values=(
-                sender, message_preview, date_str, "Unread"))
+        # Build each column in one pass, then zip them into rows
+        texts = df["text"].astype(str)
+        head = texts.str.slice(0, 50)
+        previews = head.where(texts.str.len() <= 50, head + "...").to_numpy()
+        senders = _column(df, "sender").map(
+            self.resolve_contact_name).to_numpy()
+        dates = _column(df, "sent_date").to_numpy()
+
+        # Unmapped while filling, so the tree lays out and redraws once
+        # rather than after every insert
+        self.messages_tree.pack_forget()
+        try:
+            for sender, message_preview, date_str in zip(senders, previews, dates):
+                self.messages_tree.insert('', tk.END, values=(
+                    sender, message_preview, date_str, "Unread"))
+        finally:
+            # Back in its original packing slot, ahead of the scrollbars
+            self.messages_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                                    before=self.messages_v_scrollbar)
 
     def update_stats(self, unread_count):
         """Update the statistics display"""
@@ -310,64 +591,133 @@ class ReminderUI:
         self.staged_count_label.config(
             text=f"Staged Reminders: {len(self.staged_reminders)}")
         self.last_update_label.config(
-            text=f"Last Updated: {datetime.now().strftime('%H:%M:%S')}")
+            text=f"Last Updated: {_now_hms[0]}")
 
     def process_messages(self):
         """Process unread messages and create staged reminders"""
         self.update_status("Processing messages...")
         self.process_btn.config(state='disabled', text="Processing...")
 
+        # The database read and the LLM calls both run in the background
+        threading.Thread(target=self._scan_messages, daemon=True).start()
+
+    def _scan_messages(self):
+        """Fan unread messages out to the LLM pool (background thread)"""
+        # Process messages chunk by chunk as they are read from the database
+        message_count = 0
+        processed_count = 0
+        futures = []
         try:
-            df = self.db.get_unread_imessages()
+            for chunk in self.db.iter_unread_imessages():
+                message_count += len(chunk)
+
+                messages = list(zip(_column(chunk, "sender").to_numpy(),
+                                    chunk["text"].to_numpy()))
+                for start in range(0, len(messages), _LLM_BATCH_SIZE):
+                    futures.append(self._llm_pool.submit(
+                        self._generate_staged_reminders,
+                        messages[start:start + _LLM_BATCH_SIZE]))
         except Exception as e:
-            messagebox.showerror("Database Error", str(e))
-            self.process_btn.config(
-                state='normal', text="🔄 Scan & Process Messages")
+            for future in futures:
+                future.cancel()
+            self.root.after(0, self._processing_failed, e)
             return
 
-        if df.empty:
-            messagebox.showinfo("Info", "No unread messages found.")
-            self.process_btn.config(
-                state='normal', text="🔄 Scan & Process Messages")
-            return
+        for future in as_completed(futures):
+            for staged_reminder in future.result():
+                processed_count += 1
+                self.root.after(0, self._append_staged, staged_reminder)
 
-        # Process messages and create staged reminders
-        processed_count = 0
-        for _, row in df.iterrows():
-            try:
-                sender = row.get("sender", "Unknown")
-                text = row["text"]
+        self.root.after(0, self._finish_processing,
+                        message_count, processed_count)
 
-                self.update_status(f"Processing message from {sender}...")
-                result = self.llm.generate_reminder(text, sender)
+    def _generate_staged_reminders(self, messages):
+        """Ask the LLM about a batch of (sender, text) pairs in one request,
+        returning the staged reminders for the actionable ones
 
-                if result:
-                    reminder_text, due_date, sender = result
-                    contact_name = self.resolve_contact_name(sender)
-
-                    # Create staged reminder
-                    staged_reminder = {
-                        'original_text': text,
-                        'reminder_text': reminder_text,
-                        'due_date': due_date,
-                        'sender': sender,
-                        'contact_name': contact_name,
-                        'created_at': datetime.now()
-                    }
+        Runs on an LLM pool thread.
+        """
+        try:
+            self.root.after(0, self.update_status,
+                            f"Processing {len(messages)} messages...")
+
+            # Messages seen before, even in an earlier run, skip the API
+            keys = [cache_key(self.llm.model.model_name, sender, text)
+                    for sender, text in messages]
+            results = [self.llm_cache.get(key, MISS) for key in keys]
+            missing = [idx for idx, result in enumerate(results)
+                       if result is MISS]
+
+            if missing:
+                # Take a token; it goes back into the bucket _LLM_REFILL later
+                self._llm_tokens.acquire()
+                refill = threading.Timer(
+                    _LLM_REFILL, self._llm_tokens.release)
+                refill.daemon = True
+                refill.start()
+
+                fresh = self.llm.batch_generate_reminders(
+                    [messages[idx] for idx in missing], _LLM_BATCH_SIZE,
+                    raise_errors=True)
+                for idx, result in zip(missing, fresh):
+                    if result is UNANSWERED:
+                        # Left out of the reply: stage nothing, ask again
+                        # on the next scan
+                        results[idx] = None
+                        continue
+                    results[idx] = result
+                    self.llm_cache.set(keys[idx], result)
 
-                    self.staged_reminders.append(staged_reminder)
-                    processed_count += 1
+        except Exception as e:
+            logging.error(f"Failed to process messages: {e}")
+            self.root.after(0, self.add_to_history,
+                            f"Error processing {len(messages)} messages: {str(e)}")
+            return []
+
+        staged = []
+        for (_, text), result in zip(messages, results):
+            if result:
+                reminder_text, due_date, sender = result
+                contact_name = self.resolve_contact_name(sender)
+
+                # Create staged reminder, with an ID that stays put while
+                # other reminders are added and removed around it
+                staged.append({
+                    'id': uuid.uuid4().hex,
+                    'original_text': text,
+                    'reminder_text': reminder_text,
+                    'due_date': due_date,
+                    'sender': sender,
+                    'contact_name': contact_name,
+                    'created_at': datetime.now()
+                })
+        return staged
+
+    def _append_staged(self, staged_reminder):
+        """Stage one processed reminder (Tk thread)"""
+        self.staged_reminders.append(staged_reminder)
+        self.refresh_staged_reminders_display()
+        self.staged_count_label.config(
+            text=f"Staged Reminders: {len(self.staged_reminders)}")
 
-                time.sleep(0.5)  # Brief delay to avoid API rate limits
+    def _processing_failed(self, error):
+        """Report a database error from the scan (Tk thread)"""
+        messagebox.showerror("Database Error", str(error))
+        self.process_btn.config(
+            state='normal', text="🔄 Scan & Process Messages")
+        self.update_status("Processing failed")
 
-            except Exception as e:
-                logging.error(f"Failed to process message: {e}")
-                self.add_to_history(
-                    f"Error processing message from {sender}: {str(e)}")
+    def _finish_processing(self, message_count, processed_count):
+        """Wrap up a scan once every message is processed (Tk thread)"""
+        if message_count == 0:
+            messagebox.showinfo("Info", "No unread messages found.")
+            self.process_btn.config(
+                state='normal', text="🔄 Scan & Process Messages")
+            self.update_status("Processing complete")
+            return
 
         # Update UI
-        self.refresh_staged_reminders_display()
-        self.update_stats(len(df))
+        self.update_stats(message_count)
 
         if processed_count > 0:
             self.notebook.select(1)  # Switch to staged reminders tab
@@ -382,102 +732,66 @@ class ReminderUI:
 
         self.process_btn.config(
             state='normal', text="🔄 Scan & Process Messages")
-        self.update_status("Processing complete")
+        self.update_status(
+            f"Processing complete (LLM cache: {self.llm_cache.hits} hits, {self.llm_cache.misses} misses)")
 
     def refresh_staged_reminders_display(self):
         """Refresh the staged reminders display"""
-        # Clear existing widgets
-        for widget in self.staged_scrollable_frame.winfo_children():
-            widget.destroy()
-
-        for i, reminder in enumerate(self.staged_reminders):
-            self.create_staged_reminder_widget(reminder, i)
-
-    def create_staged_reminder_widget(self, reminder, index):
-        """Create a widget for a staged reminder"""
-        # Main frame for this reminder
-        reminder_frame = ttk.LabelFrame(self.staged_scrollable_frame,
-                                        text=f"Reminder from {reminder['contact_name']}",
-                                        padding=10)
-        reminder_frame.pack(fill=tk.X, padx=5, pady=5)
-
-        # Original message display
-        orig_frame = ttk.Frame(reminder_frame)
-        orig_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(orig_frame, text="Original Message:", font=(
-            'Helvetica', 9, 'bold')).pack(anchor=tk.W)
-        orig_text = tk.Text(orig_frame, height=2,
-                            wrap=tk.WORD, font=('Helvetica', 9))
-        orig_text.insert('1.0', reminder['original_text'])
-        orig_text.config(state='disabled', bg='#f0f0f0')
-        orig_text.pack(fill=tk.X, pady=(2, 0))
-
-        # Editable reminder text
-        reminder_edit_frame = ttk.Frame(reminder_frame)
-        reminder_edit_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(reminder_edit_frame, text="Reminder Text:",
-                  font=('Helvetica', 9, 'bold')).pack(anchor=tk.W)
-        reminder_text_var = tk.StringVar(value=reminder['reminder_text'])
-        reminder_entry = ttk.Entry(
-            reminder_edit_frame, textvariable=reminder_text_var, font=('Helvetica', 10))
-        reminder_entry.pack(fill=tk.X, pady=(2, 0))
-
-        # Due date editing
-        date_frame = ttk.Frame(reminder_frame)
-        date_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(date_frame, text="Due Date:", font=(
-            'Helvetica', 9, 'bold')).pack(side=tk.LEFT)
-
-        due_date_var = tk.StringVar(
-            value=reminder['due_date'] if reminder['due_date'] != 'missing value' else '')
-        due_date_entry = ttk.Entry(
-            date_frame, textvariable=due_date_var, width=20)
-        due_date_entry.pack(side=tk.LEFT, padx=(10, 5))
-
-        # Quick date buttons
-        ttk.Button(date_frame, text="Today",
-                   command=lambda: due_date_var.set(datetime.now().strftime("date \"%m/%d/%Y 12:00 PM\""))).pack(side=tk.LEFT, padx=2)
-        ttk.Button(date_frame, text="Tomorrow",
-                   command=lambda: due_date_var.set((datetime.now() + timedelta(days=1)).strftime("date \"%m/%d/%Y 12:00 PM\""))).pack(side=tk.LEFT, padx=2)
-        ttk.Button(date_frame, text="Next Week",
-                   command=lambda: due_date_var.set((datetime.now() + timedelta(weeks=1)).strftime("date \"%m/%d/%Y 12:00 PM\""))).pack(side=tk.LEFT, padx=2)
-
-        # Action buttons
-        action_frame = ttk.Frame(reminder_frame)
-        action_frame.pack(fill=tk.X)
-
-        # Update the reminder data when values change
-        def update_reminder():
-            self.staged_reminders[index]['reminder_text'] = reminder_text_var.get(
-            )
-            self.staged_reminders[index]['due_date'] = due_date_var.get(
-            ) if due_date_var.get() else 'missing value'
-
-        # Create individual reminder button
-        create_btn = ttk.Button(action_frame, text="✅ Create This Reminder",
-                                command=lambda: self.create_individual_reminder(
-                                    index, update_reminder),
-                                style='Success.TButton')
-        create_btn.pack(side=tk.LEFT, padx=(0, 5))
-
-        # Remove reminder button
-        remove_btn = ttk.Button(action_frame, text="❌ Remove",
-                                command=lambda: self.remove_staged_reminder(
-                                    index),
-                                style='Danger.TButton')
-        remove_btn.pack(side=tk.LEFT)
-
-        # Info label
-        info_text = f"From: {reminder['sender']} | Created: {reminder['created_at'].strftime('%H:%M:%S')}"
-        ttk.Label(action_frame, text=info_text, font=(
-            'Helvetica', 8), foreground='gray').pack(side=tk.RIGHT)
+        # Today / Tomorrow / Next Week for the quick date buttons
+        now = datetime.now()
+        self._quick_dates = tuple(
+            (now + delta).strftime("date \"%m/%d/%Y 12:00 PM\"")
+            for delta in (timedelta(), timedelta(days=1), timedelta(weeks=1)))
+
+        canvas = self.staged_canvas
+        if self._row_height is None:
+            canvas.update_idletasks()
+            self._row_height = self._row_pool[0].frame.winfo_reqheight() + \
+                _STAGED_ROW_GAP
+
+        # The scroll region spans every reminder, pooled rows or not
+        canvas.configure(scrollregion=(
+            0, 0, canvas.winfo_width(), len(self.staged_reminders) * self._row_height))
+        self._layout_staged_rows()
+
+    def _on_staged_scroll(self, first, last):
+        """Keep the scrollbar in step and rebind rows for the new view"""
+        self.staged_scrollbar.set(first, last)
+        self._layout_staged_rows()
+
+    def _layout_staged_rows(self):
+        """Bind the pooled rows to the reminders in view and place them"""
+        if self._row_height is None:
+            return
 
-    def create_individual_reminder(self, index, update_callback):
+        canvas = self.staged_canvas
+        count = len(self.staged_reminders)
+        first = int(canvas.yview()[0] * count)
+        width = max(canvas.winfo_width() - 10, 1)
+
+        for i, row in enumerate(self._row_pool):
+            index = first + i
+            if index < count:
+                row.bind_to(self.staged_reminders[index])
+                canvas.coords(row.window, 5,
+                              index * self._row_height + _STAGED_ROW_GAP // 2)
+                canvas.itemconfigure(row.window, state='normal', width=width)
+            else:
+                row.unbind()
+                canvas.itemconfigure(row.window, state='hidden')
+
+    def _staged_index(self, reminder_id):
+        """Position of the staged reminder with this ID, or None"""
+        for index, reminder in enumerate(self.staged_reminders):
+            if reminder['id'] == reminder_id:
+                return index
+        return None
+
+    def create_individual_reminder(self, reminder_id):
         """Create a single reminder"""
-        update_callback()  # Update the reminder data
+        index = self._staged_index(reminder_id)
+        if index is None:
+            return
 
         reminder = self.staged_reminders[index]
         try:
@@ -486,8 +800,10 @@ class ReminderUI:
             self.add_to_history(
                 f"Created reminder: {reminder['reminder_text'][:50]}...")
 
-            # Remove from staged list
-            self.staged_reminders.pop(index)
+            # Remove from staged list, wherever it is by now
+            index = self._staged_index(reminder_id)
+            if index is not None:
+                self.staged_reminders.pop(index)
             self.refresh_staged_reminders_display()
             self.update_stats(0)  # Update count
 
@@ -498,9 +814,12 @@ class ReminderUI:
                 "Error", f"Failed to create reminder: {str(e)}")
             self.add_to_history(f"Error creating reminder: {str(e)}")
 
-    def remove_staged_reminder(self, index):
+    def remove_staged_reminder(self, reminder_id):
         """Remove a staged reminder"""
         if messagebox.askyesno("Confirm", "Remove this staged reminder?"):
+            index = self._staged_index(reminder_id)
+            if index is None:
+                return
             removed = self.staged_reminders.pop(index)
             self.refresh_staged_reminders_display()
             self.update_stats(0)
@@ -516,20 +835,19 @@ class ReminderUI:
         if not messagebox.askyesno("Confirm", f"Create all {len(self.staged_reminders)} staged reminders?"):
             return
 
-        created_count = 0
-        errors = []
+        # One bulk call instead of an AppleScript run per reminder
+        created, skipped, failed = self.rm.bulk_create_reminders(
+            [(reminder['reminder_text'], reminder['due_date'])
+             for reminder in self.staged_reminders])
+        for text in created:
+            self.add_to_history(f"Created reminder: {text[:50]}...")
+        for text in skipped:
+            self.add_to_history(f"Skipped duplicate reminder: {text[:50]}...")
 
-        # Copy list to avoid modification issues
-        for reminder in self.staged_reminders[:]:
-            try:
-                self.rm.create_reminder(
-                    (reminder['reminder_text'], reminder['due_date']))
-                created_count += 1
-                self.add_to_history(
-                    f"Created reminder: {reminder['reminder_text'][:50]}...")
-            except Exception as e:
-                errors.append(
-                    f"Failed to create '{reminder['reminder_text'][:30]}...': {str(e)}")
+        errors = [f"Failed to create '{text[:30]}...': {error}"
+                  for text, error in failed]
+        for error in errors:
+            self.add_to_history(error)
 
         # Clear all staged reminders
         self.staged_reminders.clear()
@@ -537,12 +855,18 @@ class ReminderUI:
         self.update_stats(0)
 
         # Show results
+        created_count = len(created)
+        skipped_msg = (f"\nSkipped {len(skipped)} duplicate reminders."
+                       if skipped else "")
         if errors:
-            error_msg = f"Created {created_count} reminders.\nErrors:\n" + \
+            error_msg = f"Created {created_count} reminders.{skipped_msg}\nErrors:\n" + \
                 "\n".join(errors[:5])
             if len(errors) > 5:
                 error_msg += f"\n... and {len(errors) - 5} more errors"
             messagebox.showwarning("Partial Success", error_msg)
+        elif skipped:
+            messagebox.showinfo(
+                "Success", f"Created {created_count} reminders.{skipped_msg}")
         else:
             messagebox.showinfo(
                 "Success", f"Successfully created all {created_count} reminders!")
@@ -583,18 +907,79 @@ class ReminderUI:
         ttk.Button(settings_win, text="Save",
                    command=settings_win.destroy).pack(pady=20)
 
+    def _db_mtime(self):
+        """Latest modification time of chat.db and its write-ahead log"""
+        # New messages land in chat.db-wal and only reach chat.db itself at
+        # the next checkpoint
+        mtime = 0.0
+        for path in (self.db.db_path, self.db.db_path + "-wal"):
+            try:
+                mtime = max(mtime, os.path.getmtime(path))
+            except OSError:
+                pass
+        return mtime
+
     def auto_refresh(self):
         """Auto-refresh functionality"""
         try:
-            # Only refresh if we're on the messages tab and no processing is happening
-            if (self.notebook.index(self.notebook.select()) == 0 and
+            mtime = self._db_mtime()
+            visible = self.root.state() not in ('iconic', 'withdrawn')
+
+            # Back off while the database sits unchanged, counting only ticks
+            # where the window was shown; a change or the window coming back
+            # returns to the normal interval
+            if mtime != self._seen_db_mtime or (visible and not self._was_visible):
+                self._seen_db_mtime = mtime
+                self._idle_polls = 0
+                self._refresh_interval = _REFRESH_INTERVAL_MS
+            elif visible:
+                self._idle_polls += 1
+                if self._idle_polls >= _REFRESH_IDLE_POLLS:
+                    self._refresh_interval = min(
+                        self._refresh_interval * 2, _REFRESH_MAX_INTERVAL_MS)
+            self._was_visible = visible
+
+            # Only refresh if something changed since the last refresh, the
+            # window isn't minimised or hidden, we're on the messages tab and
+            # no processing is happening
+            if (mtime != self._refreshed_db_mtime and
+                    not self._refresh_in_flight and
+                    visible and
+                    self.notebook.index(self.notebook.select()) == 0 and
                     self.process_btn['state'] != 'disabled'):
-                self.refresh_data()
-        except:
-            pass  # Ignore errors during auto-refresh
-
-        # Schedule next refresh in 30 seconds
-        self.root.after(30000, self.auto_refresh)
+                # Recorded by the refresh once it succeeds, so a failed one
+                # is tried again on the next tick
+                self.refresh_data(quiet=True, db_mtime=mtime)
+        except Exception as e:
+            logging.warning(f"Auto-refresh failed: {e}")
+
+        # Schedule the next refresh, keeping the handle so it can be cancelled
+        self._refresh_handle = self.root.after(
+            self._refresh_interval, self.auto_refresh)
+
+    def _tick_clock(self):
+        """Reformat the shared clock strings, then again in a second"""
+        now = datetime.now()
+        _now_hms[0] = now.strftime('%H:%M:%S')
+        _now_full[0] = now.strftime('%Y-%m-%d %H:%M:%S')
+        self._clock_handle = self.root.after(1000, self._tick_clock)
+
+    def _cancel_timers(self):
+        """Drop the pending auto-refresh and clock tick, if any"""
+        for attr in ('_refresh_handle', '_clock_handle'):
+            handle = getattr(self, attr, None)
+            if handle is not None:
+                try:
+                    self.root.after_cancel(handle)
+                except tk.TclError:
+                    pass  # The interpreter is already gone
+                setattr(self, attr, None)
+
+    def _on_root_destroy(self, event):
+        """Stop the timers once the main window is destroyed"""
+        # <Destroy> on the root also fires for every child widget
+        if event.widget is self.root:
+            self._cancel_timers()
 
 # # src/reminder_app/ui.py
 # import tkinter as tk
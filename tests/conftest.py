@@ -0,0 +1,56 @@
+# tests/conftest.py
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+# The app modules import each other by bare name
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "app"))
+
+# Stands in for osascript running the JXA driver: one JSON request per line
+# in, one JSON reply per line out. The bulk script logs each index to its
+# progress file and hangs on a reminder named "HANG"; the create scripts
+# answer like a successful run
+_FAKE_OSASCRIPT = '''
+import json, sys, time
+
+for line in sys.stdin:
+    request = json.loads(line)
+    script, args = request.get("script", ""), request.get("args", [])
+    out = ""
+    if "markCreated" in script:
+        progress_path, items = args[0], args[2:]
+        for i in range(1, len(items) // 3 + 1):
+            if items[i * 3 - 3] == "HANG":
+                time.sleep(60)
+            with open(progress_path, "a") as f:
+                f.write(f"{i}\\n")
+    elif "listNames" in script:
+        out = "Reminders\\x1fWork"
+    print(json.dumps({"ok": True, "out": out}), flush=True)
+'''
+
+
+def _write_executable(path, source):
+    path.write_text(source)
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+
+@pytest.fixture
+def fake_osascript(tmp_path, monkeypatch):
+    """Put a fake osascript (and an osacompile that always fails, so the
+    scripts run from source) first on PATH"""
+    import reminder
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    _write_executable(bin_dir / "osascript",
+                      f"#!{sys.executable}\n" + textwrap.dedent(_FAKE_OSASCRIPT))
+    _write_executable(bin_dir / "osacompile", "#!/bin/sh\nexit 1\n")
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(reminder, "_SCRIPT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(reminder, "_COLD_START_TIMEOUT", 0)
+    return bin_dir
@@ -0,0 +1,48 @@
+# tests/test_llm.py
+import json
+import types
+
+from llm_cache import LLMCache, cache_key
+
+
+def _client(monkeypatch, tmp_path, replies):
+    """A GeminiLLM with an LLMCache whose model answers with each reply in
+    turn, recording the prompts it is sent"""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    from llm import GeminiLLM
+
+    llm = GeminiLLM(cache=LLMCache(str(tmp_path / "cache.db")))
+    prompts = []
+
+    def generate_content(prompt, generation_config=None):
+        prompts.append(prompt)
+        return types.SimpleNamespace(text=replies.pop(0))
+
+    monkeypatch.setattr(llm.model, "generate_content", generate_content)
+    return llm, prompts
+
+
+def test_generate_reminder_answers_repeats_from_the_cache(monkeypatch, tmp_path):
+    reply = json.dumps({"actionable": True, "reminder": "Call mom", "due": "missing value"})
+    llm, prompts = _client(monkeypatch, tmp_path, [reply, json.dumps({"actionable": False})])
+
+    assert llm.generate_reminder("call mom", "Sam") == ("Call mom", "missing value", "Sam")
+    assert llm.generate_reminder("call mom", "Sam") == ("Call mom", "missing value", "Sam")
+    assert llm.generate_reminder("lol", "Sam") is None
+    assert llm.generate_reminder("lol", "Sam") is None
+    assert len(prompts) == 2
+
+
+def test_generate_reminder_shares_batch_answers_and_skips_bad_replies(monkeypatch, tmp_path):
+    llm, prompts = _client(monkeypatch, tmp_path, ["not json", "not json"])
+
+    # Stored by the batch path under the same key
+    llm._cache.set(cache_key(llm.model.model_name, "Sam", "pay rent"),
+                   ["Pay rent", "missing value", "Sam"])
+    assert llm.generate_reminder("pay rent", "Sam") == ("Pay rent", "missing value", "Sam")
+    assert prompts == []
+
+    # A malformed reply is asked again rather than cached as "no reminder"
+    assert llm.generate_reminder("call mom", "Sam") is None
+    assert llm.generate_reminder("call mom", "Sam") is None
+    assert len(prompts) == 2
@@ -0,0 +1,46 @@
+# tests/test_llm_cache.py
+import sqlite3
+import time
+
+import llm_cache
+from llm_cache import LLMCache
+
+
+def _row_keys(path):
+    with sqlite3.connect(path) as conn:
+        return {key for key, in conn.execute("SELECT key FROM llm_cache")}
+
+
+def _age(path, key, seconds):
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE llm_cache SET ts = ? WHERE key = ?",
+                     (int(time.time() - seconds), key))
+
+
+def test_expired_rows_are_deleted_on_open(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = LLMCache(path, ttl=60)
+    cache.set("old", ["a"])
+    cache.set("new", ["b"])
+    cache.close()
+    _age(path, "old", 120)
+
+    cache = LLMCache(path, ttl=60)
+    try:
+        assert _row_keys(path) == {"new"}
+        assert cache.get("new") == ["b"]
+    finally:
+        cache.close()
+
+
+def test_expired_rows_are_deleted_while_writing(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "_PRUNE_EVERY", 2)
+    path = str(tmp_path / "cache.db")
+    cache = LLMCache(path, ttl=60)
+    try:
+        cache.set("old", ["a"])
+        _age(path, "old", 120)
+        cache.set("new", ["b"])
+        assert _row_keys(path) == {"new"}
+    finally:
+        cache.close()
@@ -0,0 +1,39 @@
+# tests/test_reminder.py
+import asyncio
+
+from reminder import ReminderManager
+
+
+def test_bulk_create_timeout_keeps_reminders_made_before_it(fake_osascript):
+    rm = ReminderManager(pool_size=1, script_timeout=0.5)
+    try:
+        reminders = [("a", None), ("b", None), ("HANG", None), ("c", None)]
+        created, skipped, failed = rm.bulk_create_reminders(reminders)
+
+        assert created == ["a", "b"]
+        assert skipped == []
+        assert failed == [("HANG", "Reminder creation timed out"),
+                          ("c", "Reminder creation timed out")]
+
+        # Retrying doesn't create the ones that already exist again
+        created, skipped, failed = rm.bulk_create_reminders(reminders[:2])
+        assert (created, skipped, failed) == ([], ["a", "b"], [])
+    finally:
+        rm.close()
+
+
+def test_bulk_create_variants_split_duplicates_alike(fake_osascript):
+    reminders = [("a", None), ("b", "tomorrow"), ("c", None), ("a", None)]
+
+    results = []
+    for create in (lambda rm: rm.bulk_create_reminders(reminders),
+                   lambda rm: asyncio.run(rm.bulk_create_reminders_async(reminders))):
+        rm = ReminderManager(pool_size=2)
+        try:
+            # "c" was created a moment ago, the second "a" repeats the first
+            assert rm.create_reminder(("c", None)) is True
+            results.append(create(rm))
+        finally:
+            rm.close()
+
+    assert results[0] == results[1] == (["a", "b"], ["c", "a"], [])